@@ -261,8 +261,8 @@ class ContextEngine:
                 metadata={"hnsw:space": "cosine"}
             )
 
-            # Load file hashes
-            if self._hash_file.exists():
+            # Load file hashes (unless quick_stats already did)
+            if not self._file_hashes and self._hash_file.exists():
                 self._file_hashes = json.loads(self._hash_file.read_text())
 
             return True
@@ -566,6 +566,19 @@ class ContextEngine:
             "search_results": results[:5],
         }
 
+    def quick_stats(self) -> dict:
+        """Get the indexed file count from disk without opening ChromaDB.
+
+        Returns:
+            Dict with ``indexed_files`` (0 if there is no readable index yet)
+        """
+        if not self._file_hashes:
+            try:
+                self._file_hashes = json.loads(self._hash_file.read_text())
+            except (OSError, ValueError):
+                return {"indexed_files": 0}
+        return {"indexed_files": len(self._file_hashes)}
+
     def status(self) -> dict:
         """Get index status."""
         if not self._ensure_initialized():
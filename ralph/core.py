@@ -5,6 +5,7 @@ They take data in, return data out.
 """
 
 import re
+from collections import deque
 from typing import Literal, Optional
 
 from .models import (
@@ -58,27 +59,29 @@ def find_next_task(tree: Tree) -> Optional[TaskWithPath]:
 
 
 def find_n_tasks(tree: Tree, n: int) -> list[TaskWithPath]:
-    """Find up to N pending leaf tasks for parallel workers."""
+    """Find up to N pending leaf tasks for parallel workers.
+
+    The tree is scanned breadth-first, so the shallowest pending leaves
+    come first (ties in sibling order). Spreading workers across
+    top-level branches keeps their work independent.
+    """
     tasks: list[TaskWithPath] = []
+    if n <= 0:
+        return tasks
 
-    def dfs(node: TaskNode, path: list[str]) -> bool:
-        """Returns True if we should stop searching."""
+    queue = deque((child, [tree.name]) for child in tree.children)
+    while queue:
+        node, path = queue.popleft()
         current_path = path + [node.name]
 
         if node.is_leaf():
             if node.status == TaskStatus.PENDING:
                 tasks.append(TaskWithPath(task=node, path=current_path))
-                return len(tasks) >= n
-            return False
-
-        for child in node.children:
-            if dfs(child, current_path):
-                return True
-        return False
+                if len(tasks) >= n:
+                    break
+            continue
 
-    for child in tree.children:
-        if dfs(child, [tree.name]):
-            break
+        queue.extend((child, current_path) for child in node.children)
 
     return tasks
 
@@ -0,0 +1,78 @@
+"""TTL cache for filesystem and git probes keyed by project path.
+
+Used for checks like venv detection and git status that the UI repeats
+far more often than the underlying files change.
+"""
+
+import copy
+import functools
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_TTL = 60.0
+
+# Every cache created by ttl_cache, so entries can be dropped by path
+_CACHES: list[dict[str, tuple[float, Any]]] = []
+_LOCK = threading.Lock()
+
+
+def ttl_cache(seconds: float = DEFAULT_TTL) -> Callable[[Callable[[str], T]], Callable[[str], T]]:
+    """Cache a single-argument function of a project path for `seconds`.
+
+    Hits return a shallow copy so callers can mutate result objects freely.
+    """
+
+    def decorator(func: Callable[[str], T]) -> Callable[[str], T]:
+        cache: dict[str, tuple[float, Any]] = {}
+        with _LOCK:
+            _CACHES.append(cache)
+
+        @functools.wraps(func)
+        def wrapper(project_path: str) -> T:
+            key = str(project_path)
+            now = time.monotonic()
+            hit = cache.get(key)
+            if hit is not None and hit[0] > now:
+                return copy.copy(hit[1])
+
+            value = func(project_path)
+            # clear_prefix iterates the caches under the lock from other threads
+            with _LOCK:
+                cache[key] = (now + seconds, value)
+            return copy.copy(value)
+
+        def cache_clear() -> None:
+            with _LOCK:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def clear_prefix(project_path: str) -> None:
+    """Drop cached entries for a project path (and anything beneath it)."""
+    prefix = str(project_path)
+    if not prefix:
+        clear_all()
+        return
+
+    # Match whole path components so /x/proj doesn't drop /x/proj2
+    parent = prefix.rstrip(os.sep) + os.sep
+    with _LOCK:
+        for cache in _CACHES:
+            for key in [k for k in cache if k == prefix or k.startswith(parent)]:
+                cache.pop(key, None)
+
+
+def clear_all() -> None:
+    """Drop every cached entry."""
+    with _LOCK:
+        for cache in _CACHES:
+            cache.clear()
@@ -444,3 +444,46 @@ def list_projects() -> None:
         typer.echo(f"  [{project_id}] {project.name}{progress_str}")
         typer.echo(f"    Path: {project.path}")
         typer.echo()
+
+
+@app.command("sync")
+def sync(
+    pull: bool = typer.Option(False, "--pull", help="Pull repos that are behind"),
+    jobs: int = typer.Option(4, "--jobs", "-j", help="Number of repos to sync in parallel"),
+) -> None:
+    """Check all project repos against their remotes.
+
+    Fetches every project's git repo in parallel and reports which
+    are behind. With --pull, also pulls the ones that are behind.
+
+    Example:
+        ralph project sync --jobs 8 --pull
+    """
+    from ralph.storage import sync_all
+
+    projects_result = ProjectRepository().list_all()
+    if isinstance(projects_result, Err):
+        print_error(projects_result.error)
+        raise typer.Exit(1)
+
+    projects = projects_result.value
+    if not projects:
+        typer.echo("No projects found.")
+        return
+
+    results = sync_all([p.path for p in projects], max_workers=jobs, pull=pull)
+
+    for project, result in zip(projects, results):
+        if result.error:
+            status = f"error: {result.error}"
+        elif not result.is_git_repo:
+            status = "not a git repo"
+        elif not result.has_remote:
+            status = "no remote"
+        elif result.pulled:
+            status = f"pulled {result.commits_pulled} commit(s)"
+        elif result.was_behind:
+            status = f"behind by {result.commits_pulled} commit(s)"
+        else:
+            status = "up to date"
+        typer.echo(f"  [{project.id}] {status}")
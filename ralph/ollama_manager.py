@@ -1,6 +1,7 @@
 """Ollama model manager for VRAM lifecycle management."""
 
 import asyncio
+import contextlib
 import logging
 from typing import Optional
 
@@ -38,14 +39,21 @@ class OllamaManager:
             await self._client.aclose()
             self._client = None
 
-    async def load_model(self, model: str, is_embedding: bool = False) -> bool:
+    async def load_model(
+        self, model: str, is_embedding: bool = False, quiet_offline: bool = False
+    ) -> bool:
         """Load a model into VRAM by making a keep_alive request.
 
         Ollama keeps models in VRAM when you make a request with keep_alive.
         Setting keep_alive to -1 keeps the model loaded indefinitely.
 
         For embedding models, use the /api/embeddings endpoint.
-        For generation models, use the /api/generate endpoint.
+        For generation models, use the /api/generate endpoint with streaming
+        disabled and num_predict=0 so the server returns as soon as the weights
+        are resident instead of generating tokens.
+
+        With quiet_offline, a refused connection is only logged at debug level
+        because the caller reports Ollama being down itself.
         """
         try:
             client = await self._get_client()
@@ -68,6 +76,8 @@ class OllamaManager:
                         "model": model,
                         "prompt": "",
                         "keep_alive": -1,  # Keep loaded indefinitely
+                        "stream": False,
+                        "options": {"num_predict": 0},  # Load weights only, no tokens
                     },
                 )
 
@@ -79,8 +89,13 @@ class OllamaManager:
                 logger.error(f"Failed to load model '{model}': {response.status_code}")
                 return False
 
+        except asyncio.CancelledError:
+            # Drop the half-used connection so the next request starts clean
+            await self._close_client()
+            raise
         except httpx.ConnectError:
-            logger.error(f"Cannot connect to Ollama at {self.base_url}. Is Ollama running?")
+            log = logger.debug if quiet_offline else logger.error
+            log(f"Cannot connect to Ollama at {self.base_url}. Is Ollama running?")
             return False
         except Exception as e:
             logger.error(f"Error loading model '{model}': {e}")
@@ -109,6 +124,8 @@ class OllamaManager:
                         "model": model,
                         "prompt": "",
                         "keep_alive": 0,  # Unload immediately
+                        "stream": False,
+                        "options": {"num_predict": 0},
                     },
                 )
 
@@ -125,12 +142,12 @@ class OllamaManager:
             logger.error(f"Error unloading model '{model}': {e}")
             return False
 
-    async def load_all_models(self) -> dict[str, bool]:
+    async def load_all_models(self, quiet_offline: bool = False) -> dict[str, bool]:
         """Load all configured models into VRAM."""
         results = {}
         for model, is_embedding in MODELS:
             logger.info(f"Loading model '{model}' into VRAM...")
-            results[model] = await self.load_model(model, is_embedding)
+            results[model] = await self.load_model(model, is_embedding, quiet_offline)
         return results
 
     async def unload_all_models(self) -> dict[str, bool]:
@@ -178,16 +195,27 @@ def get_ollama_manager() -> OllamaManager:
 
 
 async def startup_load_models() -> None:
-    """Load models at application startup."""
+    """Load models at application startup.
+
+    The status check and the model loads start together so the status
+    round-trip is hidden; if Ollama turns out to be down the loads are cancelled
+    and only the warning below is logged.
+    """
     manager = get_ollama_manager()
 
-    if not await manager.check_ollama_status():
+    status_task = asyncio.create_task(manager.check_ollama_status())
+    load_task = asyncio.create_task(manager.load_all_models(quiet_offline=True))
+
+    if not await status_task:
+        load_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await load_task
         logger.warning("Ollama is not running. Models will not be preloaded.")
         logger.warning("Start Ollama with 'ollama serve' to enable AI features.")
         return
 
     logger.info("Loading Ollama models into VRAM...")
-    results = await manager.load_all_models()
+    results = await load_task
 
     for model, success in results.items():
         if success:
@@ -4,17 +4,63 @@ Validates tasks against acceptance criteria and uses local AI to fix failures.
 Uses Ollama with qwen2.5-coder:7b for code fixes.
 """
 
+import asyncio
+import contextlib
+import hashlib
 import logging
-import subprocess
+import os
+import re
+import shlex
+import signal
+import weakref
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+try:
+    import ollama
+except ImportError:  # Optional "ai" extra
+    ollama = None
+
 logger = logging.getLogger(__name__)
 
 # Configuration
 MODEL = "qwen2.5-coder:7b"
 MAX_ATTEMPTS = 3
+HEAL_CONCURRENCY = 2  # Parallel Ollama requests in heal_many_files
+
+SYSTEM_PROMPT = """You are a Self-Healing AI. A test failed in the project.
+Fix the bug in the file provided so the validation passes.
+
+Return ONLY the complete fixed file content, starting with the first line and ending with the last line.
+Do not include explanations, markdown formatting, or code fences - just the raw code."""
+
+# Output kept per stream when reporting failures to the AI (the tail has the error)
+MAX_ERROR_OUTPUT = 8192
+
+# Characters that mean a command must be run through the shell
+_SHELL_CHARS = frozenset("|&;<>()$`*?[]{}~\n")
+
+# First fenced code block in an AI response, with optional language tag
+_FENCE_RE = re.compile(r"```[A-Za-z0-9_+-]*\n(.*?)\n?```", re.DOTALL)
+
+
+# Shared async Ollama clients, one per event loop (httpx pools are loop-bound)
+_OLLAMA_CLIENTS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_ollama_client():
+    """Get the running loop's shared Ollama AsyncClient, or None if ollama isn't installed.
+
+    Heal attempts on the same loop reuse one HTTP connection pool.
+    """
+    if ollama is None:
+        return None
+    loop = asyncio.get_running_loop()
+    client = _OLLAMA_CLIENTS.get(loop)
+    if client is None:
+        client = _OLLAMA_CLIENTS[loop] = ollama.AsyncClient()
+    return client
 
 
 @dataclass
@@ -37,31 +83,50 @@ class HealingResult:
     error: Optional[str] = None
 
 
-def run_command(command: str, cwd: Optional[str] = None, timeout: int = 60) -> ValidationResult:
+def _needs_shell(command: str) -> bool:
+    """Check whether a command uses shell syntax and can't be exec'd directly.
+
+    Windows always goes through the shell so .cmd/.bat shims (npm, npx) resolve.
+    """
+    return os.name == "nt" or any(c in _SHELL_CHARS for c in command)
+
+
+async def run_command(command: str, cwd: Optional[str] = None, timeout: int = 60) -> ValidationResult:
     """Run a single validation command and capture output."""
+    proc = None
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
+        pipes = dict(
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
             cwd=cwd,
-            timeout=timeout,
+            start_new_session=os.name != "nt",  # own process group, see _kill
         )
+        if not _needs_shell(command):
+            try:
+                proc = await asyncio.create_subprocess_exec(*shlex.split(command), **pipes)
+            except FileNotFoundError:
+                pass  # Shell builtin or VAR=value prefix, let the shell handle it
+        if proc is None:
+            proc = await asyncio.create_subprocess_shell(command, **pipes)
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
         return ValidationResult(
-            success=result.returncode == 0,
+            success=proc.returncode == 0,
             command=command,
-            stdout=result.stdout,
-            stderr=result.stderr,
-            return_code=result.returncode,
+            stdout=stdout.decode(errors="replace"),
+            stderr=stderr.decode(errors="replace"),
+            return_code=proc.returncode,
         )
-    except subprocess.TimeoutExpired:
+    except TimeoutError:
+        await _kill(proc)
         return ValidationResult(
             success=False,
             command=command,
             stderr=f"Command timed out after {timeout}s",
             return_code=-1,
         )
+    except asyncio.CancelledError:
+        await _kill(proc)
+        raise
     except Exception as e:
         return ValidationResult(
             success=False,
@@ -71,26 +136,65 @@ def run_command(command: str, cwd: Optional[str] = None, timeout: int = 60) -> V
         )
 
 
-def run_validation(commands: list[str], cwd: Optional[str] = None) -> tuple[bool, list[ValidationResult]]:
-    """Run all acceptance commands and return results.
+async def _kill(proc: Optional[asyncio.subprocess.Process]) -> None:
+    """Kill a still-running subprocess and reap it.
 
-    Stops at first failure to focus the AI on one problem at a time.
+    On POSIX the whole process group is killed so grandchildren spawned by the
+    shell don't keep the output pipes open.
+    """
+    if proc is None or proc.returncode is not None:
+        return
+    try:
+        if os.name == "nt":
+            proc.kill()
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    await proc.wait()
+
+
+async def run_validation_async(
+    commands: list[str], cwd: Optional[str] = None
+) -> tuple[bool, list[ValidationResult]]:
+    """Run all acceptance commands concurrently and return results.
+
+    Commands are independent checks (lint, typecheck, tests), so they run in
+    parallel, but results are collected in the order given. The first
+    command (by position) that fails is reported and the commands after it
+    are cancelled, so the same code always yields the same failure for the
+    AI to work on.
     """
-    results = []
-
     for cmd in commands:
         logger.info(f"Running validation: {cmd}")
-        result = run_command(cmd, cwd=cwd)
-        results.append(result)
 
-        if not result.success:
-            logger.warning(f"Validation failed: {cmd}")
-            break
+    tasks = [asyncio.create_task(run_command(cmd, cwd=cwd)) for cmd in commands]
+    results: list[ValidationResult] = []
 
-    all_passed = all(r.success for r in results)
+    try:
+        for task in tasks:
+            result = await task
+            results.append(result)
+            if not result.success:
+                logger.warning(f"Validation failed: {result.command}")
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    all_passed = len(results) == len(commands) and all(r.success for r in results)
     return all_passed, results
 
 
+def run_validation(commands: list[str], cwd: Optional[str] = None) -> tuple[bool, list[ValidationResult]]:
+    """Run all acceptance commands and return results.
+
+    Synchronous wrapper around run_validation_async for non-async callers.
+    """
+    return asyncio.run(run_validation_async(commands, cwd=cwd))
+
+
 def format_error_for_ai(results: list[ValidationResult]) -> str:
     """Format validation results into error message for AI."""
     lines = []
@@ -99,22 +203,28 @@ def format_error_for_ai(results: list[ValidationResult]) -> str:
             lines.append(f"COMMAND FAILED: {r.command}")
             lines.append(f"EXIT CODE: {r.return_code}")
             if r.stdout.strip():
-                lines.append(f"STDOUT:\n{r.stdout}")
+                lines.append(f"STDOUT:\n{_tail(r.stdout)}")
             if r.stderr.strip():
-                lines.append(f"STDERR:\n{r.stderr}")
+                lines.append(f"STDERR:\n{_tail(r.stderr)}")
     return "\n".join(lines)
 
 
-def get_fix_from_ai(
+def _tail(output: str, limit: int = MAX_ERROR_OUTPUT) -> str:
+    """Keep the last `limit` characters of command output."""
+    if len(output) <= limit:
+        return output
+    return "... [truncated]\n" + output[-limit:]
+
+
+async def get_fix_from_ai(
     file_path: str,
     error_msg: str,
     task_context: str,
     model: str = MODEL,
 ) -> Optional[str]:
     """Send code + error to local Ollama and get the fixed file back."""
-    try:
-        import ollama
-    except ImportError:
+    client = get_ollama_client()
+    if client is None:
         logger.error("ollama package not installed")
         return None
 
@@ -135,37 +245,36 @@ def get_fix_from_ai(
         ".jsx": "javascript",
     }.get(ext, "code")
 
-    prompt = f"""You are a Self-Healing AI. A test failed in the project.
-Fix the bug in the file provided below so the validation passes.
-
-### TASK CONTEXT
+    # Stable parts first (system prompt, task context, file) and the error log
+    # last, so Ollama can reuse the cached prompt prefix across attempts
+    prompt = f"""### TASK CONTEXT
 {task_context}
 
-### ERROR LOG
-{error_msg}
-
 ### FILE TO FIX: {file_path}
 ### CURRENT CONTENT:
 ```{lang}
 {code}
 ```
 
-Return ONLY the complete fixed file content, starting with the first line and ending with the last line.
-Do not include explanations, markdown formatting, or code fences - just the raw code.
+### ERROR LOG
+{error_msg}
 """
 
     try:
         logger.info(f"Requesting fix from {model}...")
-        response = ollama.generate(model=model, prompt=prompt)
-        fixed_code = response["response"].strip()
+        response = await client.chat(
+            model=model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+        )
+        fixed_code = response["message"]["content"].strip()
 
         # Extract code if wrapped in markdown
-        if f"```{lang}" in fixed_code:
-            fixed_code = fixed_code.split(f"```{lang}")[1].split("```")[0].strip()
-        elif "```python" in fixed_code:
-            fixed_code = fixed_code.split("```python")[1].split("```")[0].strip()
-        elif "```" in fixed_code:
-            fixed_code = fixed_code.split("```")[1].split("```")[0].strip()
+        match = _FENCE_RE.search(fixed_code)
+        if match:
+            fixed_code = match.group(1).strip()
 
         return fixed_code
     except Exception as e:
@@ -173,13 +282,14 @@ Do not include explanations, markdown formatting, or code fences - just the raw
         return None
 
 
-def heal_file(
+async def heal_file_async(
     file_path: str,
     acceptance_commands: list[str],
     task_context: str = "",
     cwd: Optional[str] = None,
     max_attempts: int = MAX_ATTEMPTS,
     model: str = MODEL,
+    validation_lock: Optional[asyncio.Lock] = None,
 ) -> HealingResult:
     """Attempt to heal a file by running validation and applying AI fixes.
 
@@ -190,6 +300,8 @@ def heal_file(
         cwd: Working directory for running commands
         max_attempts: Maximum number of fix attempts
         model: Ollama model to use for fixes
+        validation_lock: Held while validating and while writing a fix, so
+            heals sharing a project never validate during another's write
 
     Returns:
         HealingResult with success status and details
@@ -205,12 +317,16 @@ def heal_file(
         result.error = f"File not found: {file_path}"
         return result
 
+    prev_signature: Optional[tuple[bytes, bytes]] = None
+    guard = validation_lock if validation_lock is not None else contextlib.nullcontext()
+
     for attempt in range(1, max_attempts + 1):
         result.attempts = attempt
         logger.info(f"Healing attempt {attempt}/{max_attempts}")
 
         # Run validation
-        success, validations = run_validation(acceptance_commands, cwd=cwd)
+        async with guard:
+            success, validations = await run_validation_async(acceptance_commands, cwd=cwd)
         result.validations = validations
 
         if success:
@@ -222,9 +338,20 @@ def heal_file(
             result.error = f"Max attempts ({max_attempts}) reached"
             return result
 
-        # Get fix from AI
         error_msg = format_error_for_ai(validations)
-        fixed_code = get_fix_from_ai(file_path, error_msg, task_context, model=model)
+
+        # Stop if the last fix changed neither the file nor the error
+        signature = (
+            hashlib.blake2b(path.read_bytes()).digest(),
+            hashlib.blake2b(error_msg.encode("utf-8")).digest(),
+        )
+        if signature == prev_signature:
+            result.error = "No progress: file and validation errors unchanged since last fix"
+            return result
+        prev_signature = signature
+
+        # Get fix from AI
+        fixed_code = await get_fix_from_ai(file_path, error_msg, task_context, model=model)
 
         if not fixed_code:
             result.error = "Failed to get fix from AI"
@@ -233,7 +360,8 @@ def heal_file(
         # Apply fix
         try:
             logger.info(f"Applying fix to {file_path}")
-            path.write_text(fixed_code, encoding="utf-8")
+            async with guard:
+                path.write_text(fixed_code, encoding="utf-8")
         except Exception as e:
             result.error = f"Failed to write fix: {e}"
             return result
@@ -241,7 +369,66 @@ def heal_file(
     return result
 
 
-def heal_task(
+def heal_file(
+    file_path: str,
+    acceptance_commands: list[str],
+    task_context: str = "",
+    cwd: Optional[str] = None,
+    max_attempts: int = MAX_ATTEMPTS,
+    model: str = MODEL,
+) -> HealingResult:
+    """Synchronous wrapper around heal_file_async for non-async callers."""
+    return asyncio.run(heal_file_async(
+        file_path,
+        acceptance_commands,
+        task_context=task_context,
+        cwd=cwd,
+        max_attempts=max_attempts,
+        model=model,
+    ))
+
+
+async def heal_many_files(
+    file_paths: list[str],
+    acceptance_commands: list[str],
+    task_context: str = "",
+    cwd: Optional[str] = None,
+    max_attempts: int = MAX_ATTEMPTS,
+    model: str = MODEL,
+    concurrency: int = HEAL_CONCURRENCY,
+) -> list[HealingResult]:
+    """Heal several files concurrently, with at most `concurrency` in flight.
+
+    Only the Ollama requests overlap. The heals share one project and one
+    acceptance suite, so validation runs and fix writes are serialized
+    across them; otherwise each heal would see the others' half-applied
+    rewrites.
+
+    Ollama serves parallel requests up to its KV-cache budget, so keep
+    `concurrency` in line with available VRAM.
+
+    Returns:
+        One HealingResult per file, in the order given
+    """
+    sem = asyncio.Semaphore(concurrency)
+    validation_lock = asyncio.Lock()
+
+    async def heal_one(file_path: str) -> HealingResult:
+        async with sem:
+            return await heal_file_async(
+                file_path,
+                acceptance_commands,
+                task_context=task_context,
+                cwd=cwd,
+                max_attempts=max_attempts,
+                model=model,
+                validation_lock=validation_lock,
+            )
+
+    return list(await asyncio.gather(*(heal_one(f) for f in file_paths)))
+
+
+async def heal_task_async(
     task: dict,
     project_path: str,
     task_context: str = "",
@@ -284,7 +471,7 @@ def heal_task(
     if not Path(target_file).is_absolute():
         target_file = str(Path(project_path) / target_file)
 
-    return heal_file(
+    return await heal_file_async(
         file_path=target_file,
         acceptance_commands=acceptance,
         task_context=task_context,
@@ -292,3 +479,20 @@ def heal_task(
         max_attempts=max_attempts,
         model=model,
     )
+
+
+def heal_task(
+    task: dict,
+    project_path: str,
+    task_context: str = "",
+    max_attempts: int = MAX_ATTEMPTS,
+    model: str = MODEL,
+) -> HealingResult:
+    """Synchronous wrapper around heal_task_async for non-async callers."""
+    return asyncio.run(heal_task_async(
+        task,
+        project_path,
+        task_context=task_context,
+        max_attempts=max_attempts,
+        model=model,
+    ))
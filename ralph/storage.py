@@ -4,19 +4,44 @@ Handles reading/writing JSON files for projects, trees, workers, etc.
 Each project has its own folder under projects/.
 """
 
-import json
+import atexit
+import contextlib
 import os
-from datetime import datetime
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from time import localtime, strftime, time
+from typing import Any, Optional
 
-from .models import Config, Project, Tree, WorkerList, TaskNode, TaskStatus
+import orjson
 
+from .fs_cache import clear_prefix, ttl_cache
+from .global_config import get_config_dir
+from .models import Config, Project, TaskNode, TaskStatus, Tree, TreeStats, WorkerList
 
-PROJECTS_DIR = Path(__file__).parent.parent / "projects"
-RECENT_FILE = Path(__file__).parent.parent / "recent.json"
+RALPH_DIR = Path(__file__).parent.parent.absolute()
+PROJECTS_DIR = RALPH_DIR / "projects"
+RECENT_FILE = RALPH_DIR / "recent.json"
 MAX_RECENT = 10
 
+MAX_PROGRESS_FDS = 16
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Minimum seconds between automatic git fetches of the same repo
+FETCH_INTERVAL = 15 * 60
+_FETCH_STATE_LOCK = threading.Lock()
+
+# Decoded file contents keyed by path, tagged with the (mtime_ns, size) they were read at
+_READ_CACHE: dict[Path, tuple[tuple[int, int], Any]] = {}
+
+# Task counts per tree.json, tagged with the (mtime_ns, size) they were counted at
+_STATS_CACHE: dict[Path, tuple[tuple[int, int], TreeStats]] = {}
+
 
 def ensure_projects_dir() -> Path:
     """Ensure the projects directory exists."""
@@ -24,6 +49,7 @@ def ensure_projects_dir() -> Path:
     return PROJECTS_DIR
 
 
+@lru_cache(maxsize=256)
 def get_project_dir(project_id: str) -> Path:
     """Get the directory for a specific project."""
     return PROJECTS_DIR / project_id
@@ -31,11 +57,68 @@ def get_project_dir(project_id: str) -> Path:
 
 def slugify(name: str) -> str:
     """Convert a name to a URL-safe slug."""
-    import re
-    slug = name.lower()
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)
-    slug = slug.strip("-")
-    return slug or "project"
+    return _SLUG_RE.sub("-", name.lower()).strip("-") or "project"
+
+
+# =============================================================================
+# Cached Reads
+# =============================================================================
+
+
+def _stat_key(path: Path) -> Optional[tuple[int, int]]:
+    """Return the (mtime_ns, size) signature of a file, or None if missing."""
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_cached(path: Path, parse_json: bool = True) -> Any:
+    """Read (and optionally JSON-decode) a file, reusing the last result if unchanged.
+
+    Returns None if the file does not exist. Cached values are shared, so
+    callers must build fresh models from them rather than mutating them.
+    """
+    key = _stat_key(path)
+    if key is None:
+        _READ_CACHE.pop(path, None)
+        return None
+
+    cached = _READ_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    data = orjson.loads(path.read_bytes()) if parse_json else path.read_text(encoding="utf-8")
+    _READ_CACHE[path] = (key, data)
+    return data
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write a file via a temp file + rename so readers never see a partial write."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)  # mkstemp creates files owner-only
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Serialize data as indented JSON and record it in the read cache."""
+    atomic_write_bytes(path, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    _remember(path, data)
+
+
+def _remember(path: Path, data: Any) -> None:
+    """Record just-written data so the next read skips the disk."""
+    key = _stat_key(path)
+    if key is not None:
+        _READ_CACHE[path] = (key, data)
 
 
 # =============================================================================
@@ -48,26 +131,26 @@ def list_projects() -> list[Project]:
     ensure_projects_dir()
     projects = []
 
-    for folder in PROJECTS_DIR.iterdir():
-        if folder.is_dir():
-            config_file = folder / "config.json"
-            if config_file.exists():
-                try:
-                    data = json.loads(config_file.read_text(encoding="utf-8"))
+    # DirEntry.is_dir() uses the type from the directory read, no extra stat
+    with os.scandir(PROJECTS_DIR) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            try:
+                data = _read_cached(Path(entry.path, "config.json"))
+                if data is not None:
                     projects.append(Project(**data))
-                except (json.JSONDecodeError, ValueError):
-                    pass  # Skip invalid projects
+            except ValueError:
+                pass  # Skip invalid projects (orjson.JSONDecodeError is a ValueError)
 
     return projects
 
 
 def get_project(project_id: str) -> Optional[Project]:
     """Get a project by ID."""
-    config_file = get_project_dir(project_id) / "config.json"
-    if not config_file.exists():
+    data = _read_cached(get_project_dir(project_id) / "config.json")
+    if data is None:
         return None
-
-    data = json.loads(config_file.read_text(encoding="utf-8"))
     return Project(**data)
 
 
@@ -108,10 +191,7 @@ def create_project(
     project_dir.mkdir(parents=True, exist_ok=True)
 
     config_file = project_dir / "config.json"
-    config_file.write_text(
-        json.dumps(project.model_dump(), indent=2),
-        encoding="utf-8",
-    )
+    _write_json(config_file, project.model_dump())
 
     # Create default requirements.md
     req_file = project_dir / "requirements.md"
@@ -145,7 +225,9 @@ def delete_project(project_id: str) -> bool:
     if not project_dir.exists():
         return False
 
+    _close_progress_fd(project_id)
     shutil.rmtree(project_dir)
+    _STATS_CACHE.pop(project_dir / "tree.json", None)
 
     # Clean up recent.json
     remove_from_recent(project_id)
@@ -158,19 +240,13 @@ def remove_from_recent(project_id: str) -> None:
     recent = load_recent()
     if project_id in recent:
         recent.remove(project_id)
-        RECENT_FILE.write_text(
-            json.dumps({"recent": recent}, indent=2),
-            encoding="utf-8",
-        )
+        _write_json(RECENT_FILE, {"recent": recent})
 
 
 def update_project(project: Project) -> None:
     """Update a project's configuration."""
     config_file = get_project_dir(project.id) / "config.json"
-    config_file.write_text(
-        json.dumps(project.model_dump(), indent=2),
-        encoding="utf-8",
-    )
+    _write_json(config_file, project.model_dump())
 
 
 # =============================================================================
@@ -180,13 +256,13 @@ def update_project(project: Project) -> None:
 
 def load_recent() -> list[str]:
     """Load list of recently accessed project IDs, most recent first."""
-    if not RECENT_FILE.exists():
-        return []
     try:
-        data = json.loads(RECENT_FILE.read_text(encoding="utf-8"))
-        return data.get("recent", [])
-    except (json.JSONDecodeError, ValueError):
+        data = _read_cached(RECENT_FILE)
+    except ValueError:
         return []
+    if data is None:
+        return []
+    return list(data.get("recent", []))
 
 
 def update_recent(project_id: str) -> None:
@@ -200,10 +276,7 @@ def update_recent(project_id: str) -> None:
     # Trim to max
     recent = recent[:MAX_RECENT]
     # Save
-    RECENT_FILE.write_text(
-        json.dumps({"recent": recent}, indent=2),
-        encoding="utf-8",
-    )
+    _write_json(RECENT_FILE, {"recent": recent})
 
 
 def get_projects_by_recent() -> list[Project]:
@@ -211,21 +284,9 @@ def get_projects_by_recent() -> list[Project]:
 
     Projects not in recent list appear at the end.
     """
-    recent_ids = load_recent()
-    all_projects = list_projects()
-
-    # Build lookup
-    project_map = {p.id: p for p in all_projects}
-
-    # Order by recent
-    ordered = []
-    for pid in recent_ids:
-        if pid in project_map:
-            ordered.append(project_map.pop(pid))
-
-    # Add remaining projects (not in recent)
+    project_map = {p.id: p for p in list_projects()}
+    ordered = [project_map.pop(pid) for pid in load_recent() if pid in project_map]
     ordered.extend(project_map.values())
-
     return ordered
 
 
@@ -236,21 +297,24 @@ def get_projects_by_recent() -> list[Project]:
 
 def load_tree(project_id: str) -> Optional[Tree]:
     """Load the task tree for a project."""
-    tree_file = get_project_dir(project_id) / "tree.json"
-    if not tree_file.exists():
+    data = _read_cached(get_project_dir(project_id) / "tree.json")
+    if data is None:
         return None
-
-    data = json.loads(tree_file.read_text(encoding="utf-8"))
     return Tree(**data)
 
 
+def get_tree_signature(project_id: str) -> Optional[tuple[int, int]]:
+    """Get the (mtime_ns, size) of a project's tree.json, or None if missing.
+
+    Lets callers that hold on to a Tree check whether it changed on disk.
+    """
+    return _stat_key(get_project_dir(project_id) / "tree.json")
+
+
 def save_tree(project_id: str, tree: Tree) -> None:
     """Save the task tree for a project."""
     tree_file = get_project_dir(project_id) / "tree.json"
-    tree_file.write_text(
-        json.dumps(tree.model_dump(), indent=2),
-        encoding="utf-8",
-    )
+    _write_json(tree_file, tree.model_dump())
 
 
 def create_empty_tree(project_id: str, name: str) -> Tree:
@@ -277,6 +341,65 @@ def create_empty_tree(project_id: str, name: str) -> Tree:
     return tree
 
 
+def _count_tree_data(data: dict) -> TreeStats:
+    """Count leaf tasks by status straight from decoded tree.json data."""
+    counts = {"done": 0, "pending": 0, "in-progress": 0, "blocked": 0}
+    total = 0
+    stack = list(data.get("children", ()))
+    while stack:
+        node = stack.pop()
+        children = node.get("children")
+        if children:
+            stack.extend(children)
+            continue
+        total += 1
+        status = node.get("status", TaskStatus.PENDING.value)
+        if status in counts:
+            counts[status] += 1
+
+    return TreeStats(
+        total=total,
+        done=counts["done"],
+        pending=counts["pending"],
+        in_progress=counts["in-progress"],
+        blocked=counts["blocked"],
+    )
+
+
+def load_task_counts_bulk(project_ids: list[str]) -> dict[str, Optional[TreeStats]]:
+    """Get task counts for several projects in one pass.
+
+    Counts are taken from the cached tree.json data without building Tree
+    models, and reused while a tree.json's (mtime_ns, size) is unchanged.
+    Projects with no tree map to None; projects whose tree can't be read
+    are left out so callers can fall back to load_tree.
+    """
+    counts: dict[str, Optional[TreeStats]] = {}
+    for project_id in project_ids:
+        tree_file = get_project_dir(project_id) / "tree.json"
+        key = _stat_key(tree_file)
+        if key is None:
+            _STATS_CACHE.pop(tree_file, None)
+            counts[project_id] = None
+            continue
+
+        cached = _STATS_CACHE.get(tree_file)
+        if cached is not None and cached[0] == key:
+            counts[project_id] = cached[1].model_copy()
+            continue
+
+        try:
+            data = _read_cached(tree_file)
+            stats = None if data is None else _count_tree_data(data)
+        except (OSError, ValueError, AttributeError, TypeError):
+            continue
+        if stats is not None:
+            _STATS_CACHE[tree_file] = (key, stats)
+            stats = stats.model_copy()
+        counts[project_id] = stats
+    return counts
+
+
 # =============================================================================
 # Workers
 # =============================================================================
@@ -284,21 +407,21 @@ def create_empty_tree(project_id: str, name: str) -> Tree:
 
 def load_workers(project_id: str) -> WorkerList:
     """Load worker assignments for a project."""
-    workers_file = get_project_dir(project_id) / "workers.json"
-    if not workers_file.exists():
+    data = _read_cached(get_project_dir(project_id) / "workers.json")
+    if data is None:
         return WorkerList()
-
-    data = json.loads(workers_file.read_text(encoding="utf-8"))
     return WorkerList(**data)
 
 
+def get_workers_signature(project_id: str) -> Optional[tuple[int, int]]:
+    """Get the (mtime_ns, size) of a project's workers.json, or None if missing."""
+    return _stat_key(get_project_dir(project_id) / "workers.json")
+
+
 def save_workers(project_id: str, workers: WorkerList) -> None:
     """Save worker assignments for a project."""
     workers_file = get_project_dir(project_id) / "workers.json"
-    workers_file.write_text(
-        json.dumps(workers.model_dump(), indent=2),
-        encoding="utf-8",
-    )
+    _write_json(workers_file, workers.model_dump())
 
 
 # =============================================================================
@@ -308,16 +431,15 @@ def save_workers(project_id: str, workers: WorkerList) -> None:
 
 def load_requirements(project_id: str) -> str:
     """Load requirements for a project."""
-    req_file = get_project_dir(project_id) / "requirements.md"
-    if not req_file.exists():
-        return ""
-    return req_file.read_text(encoding="utf-8")
+    content = _read_cached(get_project_dir(project_id) / "requirements.md", parse_json=False)
+    return content or ""
 
 
 def save_requirements(project_id: str, content: str) -> None:
     """Save requirements for a project."""
     req_file = get_project_dir(project_id) / "requirements.md"
-    req_file.write_text(content, encoding="utf-8")
+    atomic_write_bytes(req_file, content.encode("utf-8"))
+    _remember(req_file, content)
 
 
 # =============================================================================
@@ -325,12 +447,54 @@ def save_requirements(project_id: str, content: str) -> None:
 # =============================================================================
 
 
+# Open append-only descriptors for progress.txt, least recently used first
+_PROGRESS_FDS: OrderedDict[str, int] = OrderedDict()
+_PROGRESS_LOCK = threading.Lock()
+
+
+def _progress_fd(project_id: str) -> int:
+    """Get (or open) the append descriptor for a project's progress log.
+
+    Must be called with _PROGRESS_LOCK held.
+    """
+    fd = _PROGRESS_FDS.get(project_id)
+    if fd is not None:
+        _PROGRESS_FDS.move_to_end(project_id)
+        return fd
+
+    progress_file = get_project_dir(project_id) / "progress.txt"
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    fd = os.open(progress_file, flags, 0o644)
+    _PROGRESS_FDS[project_id] = fd
+
+    if len(_PROGRESS_FDS) > MAX_PROGRESS_FDS:
+        _, oldest = _PROGRESS_FDS.popitem(last=False)
+        os.close(oldest)
+    return fd
+
+
+def _close_progress_fd(project_id: str) -> None:
+    """Close a project's progress log descriptor if one is open."""
+    with _PROGRESS_LOCK:
+        fd = _PROGRESS_FDS.pop(project_id, None)
+        if fd is not None:
+            os.close(fd)
+
+
+@atexit.register
+def _close_all_progress_fds() -> None:
+    """Close every open progress log descriptor at interpreter exit."""
+    with _PROGRESS_LOCK:
+        while _PROGRESS_FDS:
+            os.close(_PROGRESS_FDS.popitem()[1])
+
+
 def append_progress(project_id: str, entry: str) -> None:
     """Append an entry to the progress log."""
-    progress_file = get_project_dir(project_id) / "progress.txt"
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-    with progress_file.open("a", encoding="utf-8") as f:
-        f.write(f"[{timestamp}] {entry}\n")
+    timestamp = strftime("%Y-%m-%d %H:%M", localtime())
+    line = f"[{timestamp}] {entry}\n".encode()
+    with _PROGRESS_LOCK:
+        os.write(_progress_fd(project_id), line)
 
 
 # =============================================================================
@@ -338,131 +502,137 @@ def append_progress(project_id: str, entry: str) -> None:
 # =============================================================================
 
 
+def _has_activate_script(venv_path: str) -> bool:
+    """Check a venv folder for a Windows or Unix activate script.
+
+    One directory read tells us which of Scripts/ or bin/ exists, so missing
+    candidates cost a single failed scandir instead of two stats.
+    """
+    try:
+        with os.scandir(venv_path) as entries:
+            names = {e.name for e in entries if e.is_dir()}
+    except OSError:
+        return False
+
+    if "Scripts" in names and os.path.isfile(os.path.join(venv_path, "Scripts", "activate.bat")):
+        return True
+    return "bin" in names and os.path.isfile(os.path.join(venv_path, "bin", "activate"))
+
+
+# Common venv locations relative to the project, in priority order
+_VENV_CANDIDATES = (
+    ("venv",),
+    (".venv",),
+    ("env",),
+    (".env",),
+    # Monorepo patterns
+    ("apps", "backend", "venv"),
+    ("apps", "backend", "api", "venv"),
+    ("backend", "venv"),
+)
+
+
+@ttl_cache()
 def detect_venv(project_path: str) -> Optional[str]:
-    """Auto-detect Python venv in a project directory."""
-    project = Path(project_path)
-
-    # Common venv locations to check
-    venv_candidates = [
-        project / "venv",
-        project / ".venv",
-        project / "env",
-        project / ".env",
-        # Monorepo patterns
-        project / "apps" / "backend" / "venv",
-        project / "apps" / "backend" / "api" / "venv",
-        project / "backend" / "venv",
-    ]
-
-    for venv_path in venv_candidates:
-        # Check for Windows venv
-        activate_script = venv_path / "Scripts" / "activate.bat"
-        if activate_script.exists():
-            return str(venv_path)
-
-        # Check for Unix venv
-        activate_script = venv_path / "bin" / "activate"
-        if activate_script.exists():
-            return str(venv_path)
+    """Auto-detect Python venv in a project directory.
+
+    One read of the project directory rules out candidates whose top-level
+    folder doesn't exist, so usually only the real venv is probed.
+    """
+    try:
+        with os.scandir(project_path) as entries:
+            top_level = {e.name for e in entries if e.is_dir()}
+    except OSError:
+        return None
+
+    for parts in _VENV_CANDIDATES:
+        if parts[0] not in top_level:
+            continue
+        venv_path = os.path.join(project_path, *parts)
+        if _has_activate_script(venv_path):
+            return venv_path
 
     return None
 
 
+_VENV_BLOCK = """\
+REM Activate Python virtual environment
+if exist "{activate_script}" (
+    call "{activate_script}"
+    echo [OK] Virtual environment activated
+) else (
+    echo [WARN] Venv not found: {activate_script}
+)
+
+"""
+
+_LAUNCH_TEMPLATE = """\
+@echo off
+REM Launch script for {name}
+REM Generated by Ralph
+
+echo ============================================================
+echo {name} - Ralph Development Environment
+echo ============================================================
+
+{venv_block}\
+REM Change to project directory
+cd /d "{path}"
+
+REM Set Ralph environment
+set RALPH_PROJECT_ID={id}
+set RALPH_PROJECT_DIR={project_dir}
+set RALPH_DIR={ralph_dir}
+
+REM Ensure Ralph is available in this environment
+pip show ralph >nul 2>&1 || pip install -e "{ralph_dir}" --quiet
+
+REM Pull latest changes (if git repo)
+if exist ".git" (
+    echo.
+    echo [1/3] Pulling latest changes...
+    git pull origin main 2>nul || git pull origin master 2>nul || echo No remote configured
+)
+
+echo.
+echo [2/3] Current progress:
+echo ------------------------------------------------------------
+python -m ralph.cli status --project {id} 2>nul || echo No tree configured yet
+
+echo.
+echo [3/3] Next task:
+echo ------------------------------------------------------------
+python -m ralph.cli next --project {id} 2>nul || echo No tasks available
+
+echo.
+echo ============================================================
+echo Ready to work! Commands:
+echo   ralph done       - Mark task complete
+echo   ralph validate   - Run acceptance checks
+echo   ralph next       - Get next task
+echo ============================================================
+"""
+
+
 def get_launch_script_content(project: Project) -> str:
     """Generate the content of a launch script for a project."""
-    ralph_dir = Path(__file__).parent.parent.absolute()
-    project_dir = get_project_dir(project.id).absolute()
-
-    lines = [
-        "@echo off",
-        f"REM Launch script for {project.name}",
-        f"REM Generated by Ralph",
-        "",
-        f"echo ============================================================",
-        f"echo {project.name} - Ralph Development Environment",
-        f"echo ============================================================",
-        "",
-    ]
 
     # Activate venv if configured
+    venv_block = ""
     if project.venv_path:
         venv_path = Path(project.venv_path)
         if not venv_path.is_absolute():
             venv_path = Path(project.path) / venv_path
-
-        activate_script = venv_path / "Scripts" / "activate.bat"
-        lines.extend([
-            "REM Activate Python virtual environment",
-            f'if exist "{activate_script}" (',
-            f'    call "{activate_script}"',
-            "    echo [OK] Virtual environment activated",
-            ") else (",
-            f'    echo [WARN] Venv not found: {activate_script}',
-            ")",
-            "",
-        ])
-
-    # Change to project directory
-    lines.extend([
-        "REM Change to project directory",
-        f'cd /d "{project.path}"',
-        "",
-    ])
-
-    # Set Ralph environment variables
-    lines.extend([
-        "REM Set Ralph environment",
-        f'set RALPH_PROJECT_ID={project.id}',
-        f'set RALPH_PROJECT_DIR={project_dir}',
-        f'set RALPH_DIR={ralph_dir}',
-        "",
-    ])
-
-    # Install Ralph in the venv if needed
-    lines.extend([
-        "REM Ensure Ralph is available in this environment",
-        f'pip show ralph >nul 2>&1 || pip install -e "{ralph_dir}" --quiet',
-        "",
-    ])
-
-    # Git pull (optional)
-    lines.extend([
-        "REM Pull latest changes (if git repo)",
-        'if exist ".git" (',
-        "    echo.",
-        "    echo [1/3] Pulling latest changes...",
-        "    git pull origin main 2>nul || git pull origin master 2>nul || echo No remote configured",
-        ")",
-        "",
-    ])
-
-    # Show status
-    lines.extend([
-        "echo.",
-        "echo [2/3] Current progress:",
-        "echo ------------------------------------------------------------",
-        f'python -m ralph.cli status --project {project.id} 2>nul || echo No tree configured yet',
-        "",
-        "echo.",
-        "echo [3/3] Next task:",
-        "echo ------------------------------------------------------------",
-        f'python -m ralph.cli next --project {project.id} 2>nul || echo No tasks available',
-        "",
-    ])
-
-    # Ready message
-    lines.extend([
-        "echo.",
-        "echo ============================================================",
-        "echo Ready to work! Commands:",
-        f"echo   ralph done       - Mark task complete",
-        f"echo   ralph validate   - Run acceptance checks",
-        f"echo   ralph next       - Get next task",
-        "echo ============================================================",
-        "",
-    ])
-
-    return "\n".join(lines)
+        venv_block = _VENV_BLOCK.format(activate_script=venv_path / "Scripts" / "activate.bat")
+
+    return _LAUNCH_TEMPLATE.format(
+        name=project.name,
+        id=project.id,
+        path=project.path,
+        venv_block=venv_block,
+        project_dir=get_project_dir(project.id),
+        ralph_dir=RALPH_DIR,
+    )
 
 
 def generate_launch_script(project: Project) -> Path:
@@ -471,7 +641,25 @@ def generate_launch_script(project: Project) -> Path:
     script_path = project_dir / "start.bat"
 
     content = get_launch_script_content(project)
-    script_path.write_text(content, encoding="utf-8")
+
+    # Skip the write if the script is already up to date
+    try:
+        if script_path.read_text(encoding="utf-8") == content:
+            return script_path
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    # Write the bytes directly; newlines are translated here as write_text
+    # would, so the .bat keeps CRLF endings on Windows
+    data = content.replace("\n", os.linesep).encode("utf-8")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(script_path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
     return script_path
 
@@ -511,54 +699,164 @@ class GitSyncResult:
         }
 
 
-def check_git_status(project_path: str) -> GitSyncResult:
-    """Check if a project's git repo is behind remote and needs pulling."""
+def _fetch_state_file() -> Path:
+    """Path of the persisted per-repo last-fetch timestamps."""
+    return get_config_dir() / "cache" / "repo-fetch-state.json"
+
+
+def _load_fetch_state() -> dict[str, float]:
+    """Load last-fetch timestamps keyed by project path."""
+    try:
+        return orjson.loads(_fetch_state_file().read_bytes())
+    except (OSError, ValueError):
+        return {}  # Missing or corrupt state just means "fetch"
+
+
+def _save_fetch_state(state: dict[str, float]) -> None:
+    """Persist last-fetch timestamps (best effort, it's only a throttle)."""
+    try:
+        state_file = _fetch_state_file()
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(state_file, orjson.dumps(state, option=orjson.OPT_INDENT_2))
+    except OSError:
+        pass
+
+
+def _fetch_due(project_path: str) -> bool:
+    """Check whether the repo hasn't been fetched within FETCH_INTERVAL."""
+    with _FETCH_STATE_LOCK:
+        last = _load_fetch_state().get(project_path, 0.0)
+    return time() - last >= FETCH_INTERVAL
+
+
+def _record_fetch(project_path: str) -> None:
+    """Remember that the repo was just fetched."""
+    with _FETCH_STATE_LOCK:
+        state = _load_fetch_state()
+        state[project_path] = time()
+        _save_fetch_state(state)
+
+
+def request_fetch(project_path: Optional[str] = None) -> None:
+    """Make the next check_git_status fetch again (all repos if no path given)."""
+    with _FETCH_STATE_LOCK:
+        state = _load_fetch_state()
+        if project_path is None:
+            state.clear()
+        else:
+            state.pop(project_path, None)
+        _save_fetch_state(state)
+    clear_prefix(project_path or "")
+
+
+def _open_repo(project_path: str):
+    """Open a repo in-process with pygit2, or None if pygit2 isn't installed."""
+    try:
+        import pygit2
+    except ImportError:
+        return None
+    try:
+        return pygit2.Repository(project_path)
+    except pygit2.GitError:
+        return None
+
+
+def _has_remote(project_path: str, repo=None) -> bool:
+    """Check whether the repo has any remote configured."""
     import subprocess
 
-    project = Path(project_path)
-    git_dir = project / ".git"
+    if repo is not None:
+        return len(repo.remotes) > 0
+
+    remote_check = subprocess.run(
+        ["git", "remote"],
+        cwd=project_path,
+        capture_output=True,
+        timeout=10,
+    )
+    return bool(remote_check.stdout.strip())
+
+
+def _commits_behind(project_path: str, repo=None) -> Optional[int]:
+    """Count commits in the upstream branch that HEAD doesn't have.
 
-    # Check if it's a git repo
-    if not git_dir.exists():
+    Returns None if HEAD has no upstream (detached, unborn, or untracked).
+    """
+    import subprocess
+
+    if repo is not None:
+        if repo.head_is_unborn or repo.head_is_detached:
+            return None
+        branch = repo.branches.local.get(repo.head.shorthand)
+        upstream = branch.upstream if branch is not None else None
+        if upstream is None:
+            return None
+        _, behind = repo.ahead_behind(repo.head.target, upstream.target)
+        return behind
+
+    behind_check = subprocess.run(
+        ["git", "rev-list", "--count", "HEAD..@{u}"],
+        cwd=project_path,
+        capture_output=True,
+        timeout=10,
+    )
+    if behind_check.returncode != 0:
+        return None
+    return int(behind_check.stdout.strip() or b"0")
+
+
+def _git_fetch(project_path: str) -> Optional[str]:
+    """Fetch from the remote and record it; returns an error message on failure."""
+    import subprocess
+
+    fetch = subprocess.run(
+        ["git", "fetch"],
+        cwd=project_path,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    if fetch.returncode != 0:
+        return fetch.stderr.strip() or "Fetch failed"
+    _record_fetch(project_path)
+    return None
+
+
+@ttl_cache()
+def check_git_status(project_path: str) -> GitSyncResult:
+    """Check if a project's git repo is behind remote and needs pulling.
+
+    Remote and ahead/behind lookups run in-process via pygit2 when it is
+    installed, on a single opened repo, so the fetch is the only process
+    spawned. The fetch always uses the git CLI so the user's credential
+    helpers and SSH config apply.
+    """
+    import subprocess
+
+    # Check if it's a git repo (.git is a file in worktrees and submodules)
+    if not os.path.exists(os.path.join(project_path, ".git")):
         return GitSyncResult(is_git_repo=False)
 
     result = GitSyncResult(is_git_repo=True)
 
     try:
+        repo = _open_repo(project_path)
+
         # Check if there's a remote configured
-        remote_check = subprocess.run(
-            ["git", "remote"],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if not remote_check.stdout.strip():
+        if not _has_remote(project_path, repo):
             result.has_remote = False
             return result
 
         result.has_remote = True
 
-        # Fetch from remote to update refs
-        subprocess.run(
-            ["git", "fetch"],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
+        # Fetch from remote to update refs, unless we fetched recently.
+        # A failed fetch only leaves the passive status check a little stale.
+        if _fetch_due(project_path):
+            _git_fetch(project_path)
 
         # Check how many commits behind
-        behind_check = subprocess.run(
-            ["git", "rev-list", "--count", "HEAD..@{u}"],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-
-        if behind_check.returncode == 0:
-            commits_behind = int(behind_check.stdout.strip() or "0")
+        commits_behind = _commits_behind(project_path, repo)
+        if commits_behind is not None:
             result.was_behind = commits_behind > 0
             result.commits_pulled = commits_behind
 
@@ -571,47 +869,53 @@ def check_git_status(project_path: str) -> GitSyncResult:
 
 
 def git_pull(project_path: str) -> GitSyncResult:
-    """Pull latest changes from remote if behind."""
+    """Fetch and fast-forward to the upstream if behind.
+
+    Unlike check_git_status this always fetches, so a pull is never made
+    against remote refs left over from an earlier, throttled check.
+    """
     import subprocess
 
-    # First check status
-    result = check_git_status(project_path)
+    # Check if it's a git repo (.git is a file in worktrees and submodules)
+    if not os.path.exists(os.path.join(project_path, ".git")):
+        return GitSyncResult(is_git_repo=False)
 
-    if not result.is_git_repo:
-        return result
+    result = GitSyncResult(is_git_repo=True)
 
-    if not result.has_remote:
-        return result
+    try:
+        if not _has_remote(project_path):
+            result.has_remote = False
+            return result
 
-    if result.error:
-        return result
+        result.has_remote = True
 
-    if not result.was_behind:
-        # Already up to date
-        return result
+        fetch_error = _git_fetch(project_path)
+        clear_prefix(project_path)  # Cached status predates this fetch
+        if fetch_error:
+            result.error = fetch_error
+            return result
 
-    try:
-        # Try to pull (try main first, then master)
+        commits_behind = _commits_behind(project_path, _open_repo(project_path))
+        if not commits_behind:
+            # Already up to date (or no upstream to pull from)
+            return result
+
+        result.was_behind = True
+        result.commits_pulled = commits_behind
+
+        # Refs are fresh, so fast-forward locally instead of a second
+        # network round trip
         pull_result = subprocess.run(
-            ["git", "pull", "origin", "main"],
+            ["git", "merge", "--ff-only", "@{u}"],
             cwd=project_path,
             capture_output=True,
             text=True,
             timeout=120,
         )
 
-        if pull_result.returncode != 0:
-            # Try master branch
-            pull_result = subprocess.run(
-                ["git", "pull", "origin", "master"],
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-
         if pull_result.returncode == 0:
             result.pulled = True
+            clear_prefix(project_path)  # Cached status is now out of date
         else:
             result.error = pull_result.stderr.strip() or "Pull failed"
             result.pulled = False
@@ -624,3 +928,21 @@ def git_pull(project_path: str) -> GitSyncResult:
         result.pulled = False
 
     return result
+
+
+def sync_all(
+    project_paths: list[str],
+    max_workers: int = 4,
+    pull: bool = False,
+) -> list[GitSyncResult]:
+    """Check (or pull) several project repos concurrently.
+
+    Each fetch is network-bound and independent, so they run in a bounded
+    thread pool. Results are returned in the same order as project_paths.
+    """
+    if not project_paths:
+        return []
+
+    sync = git_pull if pull else check_git_status
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(project_paths)))) as pool:
+        return list(pool.map(sync, project_paths))
@@ -4,15 +4,43 @@ The RalphApp class is the entry point for the terminal user interface.
 It manages screens, keybindings, and coordinates between the UI and core logic.
 """
 
-from typing import Optional
+from __future__ import annotations
 
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.widgets import Footer
 
-from ralph.models import TaskStatus, Project, AIConfig
-from ralph.storage import list_projects, load_tree, save_tree, load_workers, get_project
-from ralph.core import find_next_task, update_task_status, count_tasks, mark_task_done, mark_task_in_progress
+# Storage, core and the pydantic models are imported inside the actions that
+# use them, so the launcher can paint before they load
+if TYPE_CHECKING:
+    from textual.timer import Timer
+
+    from ralph.models import AIConfig, Project, TaskStatus, TaskWithPath, Tree, TreeStats
+
+
+# TreeStats field for each leaf status value
+_STAT_FIELDS = {
+    "pending": "pending",
+    "in-progress": "in_progress",
+    "done": "done",
+    "blocked": "blocked",
+}
+
+
+class ProjectStats(NamedTuple):
+    """Leaf task counts for the current project."""
+
+    total: int
+    done: int
+    pending: int
+    in_progress: int
+    blocked: int
+    progress_percent: float
 
 
 class RalphApp(App):
@@ -25,163 +53,7 @@ class RalphApp(App):
     TITLE = "Ralph - Task Manager"
     SUB_TITLE = "Hierarchical Task Management"
 
-    CSS = """
-    /* Global application styles */
-    Screen {
-        background: $surface;
-    }
-
-    /* Main layout containers */
-    #main-container {
-        layout: horizontal;
-        height: 100%;
-    }
-
-    #left-panel {
-        width: 50%;
-        height: 100%;
-        border-right: solid $primary;
-        layout: vertical;
-    }
-
-    #right-panel {
-        width: 50%;
-        height: 100%;
-        layout: vertical;
-    }
-
-    #tabbed-section {
-        height: 60%;
-        border-bottom: solid $primary;
-    }
-
-    #task-details {
-        height: 40%;
-    }
-
-    /* Terminal widget styling */
-    TerminalWidget {
-        height: 100%;
-        border: solid $secondary;
-    }
-
-    /* Tree view styling */
-    TaskTreeWidget {
-        height: 100%;
-    }
-
-    /* Task panel styling */
-    TaskPanel {
-        height: 100%;
-        padding: 1;
-    }
-
-    /* Status panel styling */
-    StatusPanel {
-        height: 100%;
-        padding: 1;
-    }
-
-    /* Footer styling */
-    Footer {
-        dock: bottom;
-        height: 1;
-        background: $primary;
-    }
-
-    /* TabbedContent styling */
-    TabbedContent {
-        height: 100%;
-    }
-
-    ContentSwitcher {
-        height: 100%;
-    }
-
-    TabPane {
-        height: 100%;
-        padding: 0;
-    }
-
-    /* Chat widget in left panel */
-    #left-tabs {
-        height: 100%;
-    }
-
-    ChatWidget {
-        height: 100%;
-        border: none;
-    }
-
-    /* Project select screen */
-    #project-list {
-        height: 100%;
-        padding: 1;
-    }
-
-    .project-item {
-        padding: 1;
-        margin: 1;
-        border: solid $secondary;
-    }
-
-    .project-item:hover {
-        background: $surface-lighten-1;
-    }
-
-    .project-item:focus {
-        border: solid $primary;
-        background: $surface-lighten-2;
-    }
-
-    /* Modal styling */
-    #worker-modal {
-        width: 60;
-        height: 20;
-        border: thick $primary;
-        background: $surface;
-        padding: 1;
-    }
-
-    /* Help modal */
-    #help-modal {
-        width: 70;
-        height: 25;
-        border: thick $primary;
-        background: $surface;
-        padding: 1;
-    }
-
-    /* Progress indicators */
-    .progress-bar {
-        height: 1;
-        margin: 1 0;
-    }
-
-    /* Status colors */
-    .status-pending {
-        color: $text-muted;
-    }
-
-    .status-in-progress {
-        color: $warning;
-    }
-
-    .status-done {
-        color: $success;
-    }
-
-    .status-blocked {
-        color: $error;
-    }
-
-    /* Section headers */
-    .section-header {
-        text-style: bold;
-        padding: 0 1;
-        background: $primary-darken-2;
-    }
-    """
+    CSS_PATH = "app.tcss"
 
     BINDINGS = [
         Binding("n", "next_task", "Next Task", show=True),
@@ -208,6 +80,23 @@ class RalphApp(App):
         self._current_project: Optional[Project] = None
         self._selected_task_path: Optional[list[str]] = None
         self._ai_config: Optional[AIConfig] = None
+        # Current project's tree and the tree.json signature it was loaded at
+        self._tree: Optional[Tree] = None
+        self._tree_signature: Optional[tuple[int, int]] = None
+        # Index over self._tree, rebuilt whenever the tree is (re)loaded:
+        # leaf path -> status, pending leaves in DFS order, and leaf counts
+        self._leaf_status: dict[tuple[str, ...], TaskStatus] = {}
+        self._pending_queue: deque[TaskWithPath] = deque()
+        self._stats: Optional[TreeStats] = None
+        # Snapshot of _stats handed out by get_project_stats until it changes
+        self._project_stats: Optional[ProjectStats] = None
+        # Single-slot save queue: only the latest tree is written
+        self._pending_save: Optional[tuple[str, Tree]] = None
+        self._save_running = False
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        # Pending trailing-edge tree widget refresh
+        self._refresh_timer: Optional[Timer] = None
 
     @property
     def current_project(self) -> Optional[Project]:
@@ -268,9 +157,12 @@ class RalphApp(App):
         Returns:
             True if the project was loaded successfully.
         """
+        from ralph.storage import get_project
+
         project = get_project(project_id)
         if project:
             self._current_project = project
+            self._tree = None
             return True
         return False
 
@@ -280,23 +172,27 @@ class RalphApp(App):
 
     def action_next_task(self) -> None:
         """Mark the next pending task as in-progress."""
+        from ralph.core import mark_task_in_progress
+        from ralph.models import TaskStatus
+
         if not self._current_project:
             self.notify("No project loaded", severity="warning")
             return
 
-        tree = load_tree(self._current_project.id)
+        tree = self._get_tree()
         if not tree:
             self.notify("No task tree found", severity="warning")
             return
 
-        next_task = find_next_task(tree)
+        next_task = self._pop_pending()
         if not next_task:
             self.notify("No pending tasks found", severity="info")
             return
 
         # Mark as in-progress
         updated_tree = mark_task_in_progress(tree, next_task.path)
-        save_tree(self._current_project.id, updated_tree)
+        self._save_tree(updated_tree)
+        self._set_leaf_status(next_task.path, TaskStatus.IN_PROGRESS)
 
         # Update selection
         self._selected_task_path = next_task.path
@@ -307,6 +203,9 @@ class RalphApp(App):
 
     def action_mark_done(self) -> None:
         """Mark the currently selected task as done."""
+        from ralph.core import mark_task_done
+        from ralph.models import TaskStatus
+
         if not self._current_project:
             self.notify("No project loaded", severity="warning")
             return
@@ -315,14 +214,15 @@ class RalphApp(App):
             self.notify("No task selected", severity="warning")
             return
 
-        tree = load_tree(self._current_project.id)
+        tree = self._get_tree()
         if not tree:
             self.notify("No task tree found", severity="warning")
             return
 
         # Mark as done
         updated_tree = mark_task_done(tree, self._selected_task_path)
-        save_tree(self._current_project.id, updated_tree)
+        self._save_tree(updated_tree)
+        self._set_leaf_status(self._selected_task_path, TaskStatus.DONE)
 
         task_name = self._selected_task_path[-1] if self._selected_task_path else "Task"
         self.notify(f"Completed: {task_name}", severity="information")
@@ -333,6 +233,8 @@ class RalphApp(App):
 
     def action_validate(self) -> None:
         """Run acceptance criteria in the terminal."""
+        from ralph.core import find_task_by_path
+
         if not self._current_project:
             self.notify("No project loaded", severity="warning")
             return
@@ -341,12 +243,11 @@ class RalphApp(App):
             self.notify("No task selected - select a task first", severity="warning")
             return
 
-        tree = load_tree(self._current_project.id)
+        tree = self._get_tree()
         if not tree:
             self.notify("No task tree found", severity="warning")
             return
 
-        from ralph.core import find_task_by_path
         task = find_task_by_path(tree, self._selected_task_path)
 
         if not task:
@@ -363,11 +264,24 @@ class RalphApp(App):
 
     def action_assign_workers(self) -> None:
         """Show the worker assignment modal."""
-        from ralph.tui.screens.main import WorkerModal
-        self.push_screen(WorkerModal())
+        from ralph.tui.screens.main import MainScreen, WorkerModal
+
+        def refresh_workers(assigned: Optional[bool]) -> None:
+            if assigned and isinstance(self.screen, MainScreen):
+                self.screen._schedule_refresh()
+
+        self.push_screen(WorkerModal(), refresh_workers)
 
     def action_refresh(self) -> None:
         """Refresh the task tree display."""
+        from ralph.fs_cache import clear_all
+        from ralph.storage import request_fetch
+
+        clear_all()  # Drop cached venv / git probes so they re-run
+        self._write_pending_save()  # Don't reload over an unsaved change
+        self._tree = None
+        if self._current_project:
+            request_fetch(self._current_project.path)
         self._refresh_tree_widget()
         self.notify("Refreshed", severity="information")
 
@@ -388,8 +302,152 @@ class RalphApp(App):
     # Helper Methods
     # =========================================================================
 
+    def _get_tree(self) -> Optional[Tree]:
+        """Get the current project's tree, reloading only if tree.json changed.
+
+        The file is re-checked on every call because the embedded terminal
+        (e.g. `ralph done`) can update it from another process.
+        """
+        from ralph.storage import get_tree_signature, load_tree
+
+        if not self._current_project:
+            return None
+
+        if self._tree is not None:
+            with self._save_lock:
+                if self._save_running:
+                    # tree.json is behind self._tree until the queued save lands
+                    return self._tree
+
+        signature = get_tree_signature(self._current_project.id)
+        if self._tree is None or signature != self._tree_signature:
+            self._tree = load_tree(self._current_project.id)
+            self._tree_signature = signature
+            self._index_tree(self._tree)
+        return self._tree
+
+    def get_tree(self) -> Optional[Tree]:
+        """Get the current project's tree, including changes not yet saved.
+
+        Screens read the tree through here rather than loading tree.json
+        themselves, which would lag behind background saves.
+        """
+        return self._get_tree()
+
+    def _index_tree(self, tree: Optional[Tree]) -> None:
+        """Build the leaf status index, pending queue and stats in one DFS."""
+        from ralph.models import TaskStatus, TaskWithPath, TreeStats
+
+        self._leaf_status = {}
+        self._pending_queue = deque()
+        self._project_stats = None
+        if tree is None:
+            self._stats = None
+            return
+
+        stack = [(child, [tree.name]) for child in reversed(tree.children)]
+        while stack:
+            node, parent_path = stack.pop()
+            path = parent_path + [node.name]
+            if node.is_leaf():
+                self._leaf_status[tuple(path)] = node.status
+                if node.status == TaskStatus.PENDING:
+                    self._pending_queue.append(TaskWithPath(task=node, path=path))
+            else:
+                stack.extend((child, path) for child in reversed(node.children))
+
+        statuses = list(self._leaf_status.values())
+        self._stats = TreeStats(
+            total=len(statuses),
+            done=statuses.count(TaskStatus.DONE),
+            pending=statuses.count(TaskStatus.PENDING),
+            in_progress=statuses.count(TaskStatus.IN_PROGRESS),
+            blocked=statuses.count(TaskStatus.BLOCKED),
+        )
+
+    def _pop_pending(self) -> Optional[TaskWithPath]:
+        """Pop the first leaf that is still pending (same order as find_next_task)."""
+        from ralph.models import TaskStatus
+
+        while self._pending_queue:
+            candidate = self._pending_queue.popleft()
+            if self._leaf_status.get(tuple(candidate.path)) == TaskStatus.PENDING:
+                return candidate
+        return None
+
+    def _set_leaf_status(self, path: list[str], status: TaskStatus) -> None:
+        """Record a status change in the index, adjusting the cached stats."""
+        key = tuple(path)
+        old = self._leaf_status.get(key)
+        if old is None or self._stats is None:
+            return  # Not a leaf - leaf counts are unaffected
+
+        self._leaf_status[key] = status
+        self._project_stats = None
+        for value, delta in ((old, -1), (status, 1)):
+            field = _STAT_FIELDS.get(value)
+            if field:
+                setattr(self._stats, field, getattr(self._stats, field) + delta)
+
+    def _save_tree(self, tree: Tree) -> None:
+        """Keep the tree as the cached copy and persist it in the background.
+
+        Rapid actions coalesce: if a save is already running, only the most
+        recent tree is written after it.
+        """
+        self._tree = tree
+        with self._save_lock:
+            self._pending_save = (self._current_project.id, tree)
+            if self._save_running:
+                return
+            self._save_running = True
+        self._save_worker()
+
+    @work(thread=True, group="save-tree")
+    def _save_worker(self) -> None:
+        """Write queued trees until the queue is empty."""
+        while self._write_pending_save():
+            pass
+
+    def _write_pending_save(self) -> bool:
+        """Write the queued tree, if any. Returns False once nothing was queued."""
+        from ralph.storage import get_tree_signature, save_tree
+
+        # Hold the write lock across dequeue + write so saves land in order
+        with self._write_lock:
+            with self._save_lock:
+                pending = self._pending_save
+                self._pending_save = None
+                if pending is None:
+                    self._save_running = False
+                    return False
+
+            project_id, tree = pending
+            save_tree(project_id, tree)
+            # Our own write must not look like an external change, even when
+            # a newer tree is already queued behind it
+            if self._current_project and self._current_project.id == project_id:
+                self._tree_signature = get_tree_signature(project_id)
+        return True
+
+    def on_unmount(self) -> None:
+        """Flush any queued tree save before exiting."""
+        self._write_pending_save()
+
     def _refresh_tree_widget(self) -> None:
+        """Schedule a tree widget refresh, coalescing bursts within 50 ms."""
+        if self._refresh_timer is not None:
+            return
+        self._refresh_timer = self.set_timer(0.05, self._do_refresh_tree)
+
+    def _do_refresh_tree(self) -> None:
         """Refresh the tree widget on the current screen."""
+        self._refresh_timer = None
+        from ralph.tui.screens.main import MainScreen
+        if isinstance(self.screen, MainScreen):
+            # Reloads the widget from the current tree along with the stats
+            self.screen._schedule_refresh()
+            return
         try:
             from ralph.tui.widgets import TaskTreeWidget
             tree_widget = self.query_one(TaskTreeWidget)
@@ -400,9 +458,10 @@ class RalphApp(App):
     def _run_in_terminal(self, commands: list[str]) -> None:
         """Run commands in the terminal widget."""
         try:
-            from ralph.tui.widgets import TerminalWidget
             from textual.widgets import TabbedContent
 
+            from ralph.tui.widgets import TerminalWidget
+
             # Switch to terminal tab
             try:
                 tabs = self.query_one("#left-tabs", TabbedContent)
@@ -417,25 +476,31 @@ class RalphApp(App):
         except Exception:
             self.notify("Terminal not available", severity="error")
 
-    def get_project_stats(self) -> Optional[dict]:
-        """Get statistics for the current project."""
+    def get_project_stats(self) -> Optional[ProjectStats]:
+        """Get statistics for the current project.
+
+        The same ProjectStats is returned until the counts change; use
+        ``_asdict()`` on it where a dict is needed.
+        """
         if not self._current_project:
             return None
 
-        tree = load_tree(self._current_project.id)
-        if not tree:
+        tree = self._get_tree()
+        if not tree or self._stats is None:
             return None
 
-        stats = count_tasks(tree)
-        return {
-            "total": stats.total,
-            "done": stats.done,
-            "pending": stats.pending,
-            "in_progress": stats.in_progress,
-            "blocked": stats.blocked,
-            "progress_percent": stats.progress_percent,
-        }
+        if self._project_stats is None:
+            stats = self._stats
+            self._project_stats = ProjectStats(
+                stats.total,
+                stats.done,
+                stats.pending,
+                stats.in_progress,
+                stats.blocked,
+                stats.progress_percent,
+            )
+        return self._project_stats
 
 
 # Export for easy importing
-__all__ = ["RalphApp"]
+__all__ = ["ProjectStats", "RalphApp"]
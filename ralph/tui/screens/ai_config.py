@@ -3,8 +3,14 @@
 Allows users to configure which AI provider to use for different tasks.
 """
 
+import asyncio
+import copy
+import os
+import re
+import time
 from typing import TYPE_CHECKING, Optional
 
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.message import Message
@@ -17,8 +23,74 @@ if TYPE_CHECKING:
     from ralph.tui.app import RalphApp
 
 
-def check_ollama_status() -> dict:
-    """Check Ollama availability and model status."""
+# How long a successful check_ollama_status result is reused
+OLLAMA_STATUS_TTL = 30.0
+
+# Seconds to wait on the Ollama daemon before reporting it unavailable
+OLLAMA_TIMEOUT = 2.0
+
+# Model names that look like embedding models
+_EMBED_MODEL_RE = re.compile(r"embed|nomic|bge|e5", re.IGNORECASE)
+
+# Last successful status, keyed by the Ollama host it came from
+_OLLAMA_STATUS_CACHE: dict = {"ts": 0.0, "host": None, "value": None}
+
+
+def invalidate_ollama_cache() -> None:
+    """Force the next check_ollama_status call to query Ollama again."""
+    _OLLAMA_STATUS_CACHE["value"] = None
+
+
+async def _list_installed_models(host: str) -> list[str]:
+    """Return installed model names from Ollama's /api/tags endpoint.
+
+    Uses httpx directly; the ollama SDK is only a fallback for installs
+    without httpx. Either way the request is bounded by OLLAMA_TIMEOUT.
+    """
+    try:
+        import httpx
+    except ImportError:
+        import ollama
+        async with asyncio.timeout(OLLAMA_TIMEOUT):
+            models_response = await ollama.AsyncClient().list()
+
+        # Handle both old dict format and new ListResponse object
+        if hasattr(models_response, 'models'):
+            return [m.model for m in models_response.models if hasattr(m, 'model')]
+        return [m.get("name", "") for m in models_response.get("models", [])]
+
+    from ralph.ollama_manager import OLLAMA_BASE_URL
+
+    base_url = host or OLLAMA_BASE_URL
+    if "://" not in base_url:
+        base_url = f"http://{base_url}"
+
+    try:
+        async with asyncio.timeout(OLLAMA_TIMEOUT), httpx.AsyncClient() as client:
+            response = await client.get(f"{base_url.rstrip('/')}/api/tags")
+            response.raise_for_status()
+    except (httpx.ConnectError, httpx.TimeoutException, TimeoutError):
+        raise ConnectionError(f"Ollama not reachable at {base_url}") from None
+    except httpx.HTTPStatusError as e:
+        raise ConnectionError(f"Ollama returned HTTP {e.response.status_code}") from None
+
+    return [m.get("name", "") for m in response.json().get("models", [])]
+
+
+async def check_ollama_status_async() -> dict:
+    """Check Ollama availability and model status.
+
+    Successful results are cached for OLLAMA_STATUS_TTL seconds per host.
+    """
+    host = os.environ.get("OLLAMA_HOST", "")
+    cached = _OLLAMA_STATUS_CACHE["value"]
+    if (
+        cached is not None
+        and _OLLAMA_STATUS_CACHE["host"] == host
+        and time.monotonic() - _OLLAMA_STATUS_CACHE["ts"] < OLLAMA_STATUS_TTL
+    ):
+        return copy.deepcopy(cached)
+
     result = {
         "available": False,
         "models": [],
@@ -33,42 +105,42 @@ def check_ollama_status() -> dict:
     required_embed = "nomic-embed-text"
 
     try:
-        import ollama
-        models_response = ollama.list()
-
-        # Handle both old dict format and new ListResponse object
-        if hasattr(models_response, 'models'):
-            installed_full = [m.model for m in models_response.models if hasattr(m, 'model')]
-        else:
-            installed_full = [m.get("name", "") for m in models_response.get("models", [])]
+        installed_full = await _list_installed_models(host)
 
         result["available"] = True
         result["models"] = installed_full
 
-        # Categorize models
-        embed_keywords = ["embed", "nomic", "bge", "e5"]
+        # Categorize models and collect their base names (without the tag)
+        installed_base = set()
         for model in installed_full:
-            model_lower = model.lower()
-            if any(kw in model_lower for kw in embed_keywords):
+            installed_base.add(model.split(":", 1)[0])
+            if _EMBED_MODEL_RE.search(model):
                 result["embed_models"].append(model)
             else:
                 result["llm_models"].append(model)
 
         # Check for required models
-        installed_base = [name.split(":")[0] for name in installed_full]
         if required_llm not in installed_base:
             result["missing_models"].append(required_llm)
         if required_embed not in installed_base:
             result["missing_models"].append(required_embed)
 
     except ImportError:
-        result["error"] = "ollama package not installed"
+        result["error"] = "httpx or ollama package not installed"
+        return result
     except Exception as e:
         result["error"] = str(e)
+        return result
 
+    _OLLAMA_STATUS_CACHE.update(ts=time.monotonic(), host=host, value=copy.deepcopy(result))
     return result
 
 
+def check_ollama_status() -> dict:
+    """Synchronous wrapper around check_ollama_status_async for non-TUI callers."""
+    return asyncio.run(check_ollama_status_async())
+
+
 class AIConfigComplete(Message):
     """Message sent when AI configuration is complete."""
     def __init__(self, config: AIConfig) -> None:
@@ -218,6 +290,10 @@ class AIConfigScreen(Screen):
         super().__init__()
         self._config = AIConfig()
         self._ollama_status: dict = {}
+        self._widgets: dict = {}  # Handles to the config inputs, filled on mount
+        self._status_class: Optional[str] = None  # Status class on #ollama-status
+        self._status_text: Optional[str] = None  # Markup shown in #ollama-status-text
+        self._completing = False
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -282,34 +358,62 @@ class AIConfigScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Check Ollama status when screen mounts."""
-        self._check_ollama()
-
-    def _check_ollama(self) -> None:
-        """Check Ollama status and update display."""
-        self._ollama_status = check_ollama_status()
+        """Cache the config input widgets and check Ollama status."""
+        for widget_id in (
+            "planning-claude",
+            "planning-local",
+            "context-claude",
+            "context-local",
+            "coding-claude",
+            "coding-local",
+        ):
+            self._widgets[widget_id.replace("-", "_")] = self.query_one(f"#{widget_id}", RadioButton)
+        self._widgets["llm_select"] = self.query_one("#llm-select", Select)
+
+        self._fetch_ollama_status()
+
+    @work(exclusive=True, group="ollama-status")
+    async def _fetch_ollama_status(self) -> None:
+        """Query Ollama without blocking the event loop, then apply the result."""
+        self._apply_ollama_status(await check_ollama_status_async())
+
+    def _apply_ollama_status(self, status: dict) -> None:
+        """Update the status display and model list from an Ollama status."""
+        self._ollama_status = status
         status_container = self.query_one("#ollama-status", Vertical)
         status_text = self.query_one("#ollama-status-text", Label)
         models_list = self.query_one("#ollama-models-list", Label)
 
-        # Remove old status classes
-        status_container.remove_class("status-ok", "status-warning", "status-error")
-
-        if self._ollama_status.get("error"):
-            status_container.add_class("status-error")
-            status_text.update(f"[red]Not available: {self._ollama_status['error']}[/red]")
+        status = self._ollama_status
+        new_cls: Optional[str] = None
+        new_text: Optional[str] = None
+        if status.get("error"):
+            new_cls = "status-error"
+            new_text = f"[red]Not available: {status['error']}[/red]"
             models_list.update("")
-        elif self._ollama_status.get("missing_models"):
-            status_container.add_class("status-warning")
-            missing = ", ".join(self._ollama_status["missing_models"])
-            status_text.update(f"[yellow]Missing: {missing}[/yellow]")
+        elif status.get("missing_models"):
+            new_cls = "status-warning"
+            missing = ", ".join(status["missing_models"])
+            new_text = f"[yellow]Missing: {missing}[/yellow]"
             # Still show installed models
             self._update_models_list(models_list)
-        elif self._ollama_status.get("available"):
-            status_container.add_class("status-ok")
-            status_text.update("[green]Ready[/green]")
+        elif status.get("available"):
+            new_cls = "status-ok"
+            new_text = "[green]Ready[/green]"
             self._update_models_list(models_list)
 
+        # Only touch classes and text that actually change, since each class
+        # change restyles the container
+        if new_cls != self._status_class:
+            if self._status_class:
+                status_container.remove_class(self._status_class)
+            if new_cls:
+                status_container.add_class(new_cls)
+            self._status_class = new_cls
+        if new_text is not None and new_text != self._status_text:
+            status_text.update(new_text)
+            self._status_text = new_text
+
         # Populate the LLM select dropdown
         self._populate_llm_select()
 
@@ -330,7 +434,7 @@ class AIConfigScreen(Screen):
 
     def _populate_llm_select(self) -> None:
         """Populate the LLM select dropdown with available models."""
-        llm_select = self.query_one("#llm-select", Select)
+        llm_select = self._widgets["llm_select"]
         llm_models = self._ollama_status.get("llm_models", [])
 
         if not llm_models:
@@ -341,14 +445,8 @@ class AIConfigScreen(Screen):
         options = [(model, model) for model in llm_models]
         llm_select.set_options(options)
 
-        # Select the first model by default, or preferred model if available
-        for model in llm_models:
-            if "qwen2.5-coder" in model:
-                llm_select.value = model
-                break
-        else:
-            # No preferred model found, select first
-            llm_select.value = llm_models[0]
+        # Select the preferred model if available, otherwise the first
+        llm_select.value = next((m for m in llm_models if "qwen2.5-coder" in m), llm_models[0])
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -368,13 +466,12 @@ class AIConfigScreen(Screen):
 
     def _apply_preset(self, preset: str) -> None:
         """Apply a preset configuration."""
-        # Get radio buttons directly
-        planning_claude = self.query_one("#planning-claude", RadioButton)
-        planning_local = self.query_one("#planning-local", RadioButton)
-        context_claude = self.query_one("#context-claude", RadioButton)
-        context_local = self.query_one("#context-local", RadioButton)
-        coding_claude = self.query_one("#coding-claude", RadioButton)
-        coding_local = self.query_one("#coding-local", RadioButton)
+        planning_claude = self._widgets["planning_claude"]
+        planning_local = self._widgets["planning_local"]
+        context_claude = self._widgets["context_claude"]
+        context_local = self._widgets["context_local"]
+        coding_claude = self._widgets["coding_claude"]
+        coding_local = self._widgets["coding_local"]
 
         if preset == "claude":
             # All Claude
@@ -396,10 +493,10 @@ class AIConfigScreen(Screen):
 
     def _get_current_config(self) -> AIConfig:
         """Get the current configuration from radio buttons and LLM select."""
-        planning_claude = self.query_one("#planning-claude", RadioButton)
-        context_claude = self.query_one("#context-claude", RadioButton)
-        coding_claude = self.query_one("#coding-claude", RadioButton)
-        llm_select = self.query_one("#llm-select", Select)
+        planning_claude = self._widgets["planning_claude"]
+        context_claude = self._widgets["context_claude"]
+        coding_claude = self._widgets["coding_claude"]
+        llm_select = self._widgets["llm_select"]
 
         # Get the selected LLM model
         selected_model = llm_select.value
@@ -415,11 +512,21 @@ class AIConfigScreen(Screen):
 
     def _complete(self) -> None:
         """Complete configuration and proceed."""
+        # Ignore repeat presses while the first one is leaving the screen
+        if self._completing:
+            return
+        self._completing = True
+
         config = self._get_current_config()
 
-        # Save to global config
-        from ralph.global_config import save_global_config
-        save_global_config(config)
+        # Save to global config, unless it already holds these settings
+        from ralph.global_config import get_global_config, save_global_config
+        try:
+            if config != get_global_config():
+                save_global_config(config)
+        except Exception:
+            self._completing = False
+            raise
 
         # Set config on app
         app = self.app
@@ -448,4 +555,10 @@ class AIConfigScreen(Screen):
         self.app.pop_screen()
 
 
-__all__ = ["AIConfigScreen", "AIConfigComplete"]
+__all__ = [
+    "AIConfigScreen",
+    "AIConfigComplete",
+    "check_ollama_status",
+    "check_ollama_status_async",
+    "invalidate_ollama_cache",
+]
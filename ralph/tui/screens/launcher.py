@@ -3,9 +3,15 @@
 Provides a radio button menu for intuitive project selection.
 """
 
+from __future__ import annotations
+
+import asyncio
+import os
+import stat
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.message import Message
@@ -21,14 +27,52 @@ from textual.widgets import (
     Static,
 )
 
-from ralph.models import Project
-from ralph.storage import list_projects, load_tree, create_project, create_empty_tree
-from ralph.core import count_tasks
-
+# Storage, core and the pydantic models are imported where they are used,
+# so the launcher can paint before they load
 if TYPE_CHECKING:
+    from ralph.models import Project
     from ralph.tui.app import RalphApp
 
 
+def _projects_progress(project_ids: list[str]) -> dict[str, str]:
+    """Describe each project's task progress for its launcher row."""
+    from ralph.core import count_tasks
+    from ralph.storage import load_task_counts_bulk, load_tree
+
+    try:
+        counts = load_task_counts_bulk(project_ids)
+    except Exception:
+        counts = {}
+
+    progress: dict[str, str] = {}
+    for project_id in project_ids:
+        try:
+            if project_id in counts:
+                stats = counts[project_id]
+            else:
+                tree = load_tree(project_id)
+                stats = count_tasks(tree) if tree else None
+        except Exception:
+            progress[project_id] = "Error loading"
+            continue
+
+        if stats:
+            progress[project_id] = (
+                f"{stats.done}/{stats.total} tasks ({stats.progress_percent:.0f}%)"
+            )
+        else:
+            progress[project_id] = "No tasks yet"
+    return progress
+
+
+class ProjectRadioButton(RadioButton):
+    """Launcher row that carries the project it represents."""
+
+    def __init__(self, label: str, project: Project) -> None:
+        super().__init__(label, id=f"project-{project.id}")
+        self.project = project
+
+
 class ProjectOpened(Message):
     """Message sent when a project is selected to open."""
     def __init__(self, project_id: str) -> None:
@@ -163,6 +207,8 @@ class LauncherScreen(Screen):
         self._creating_new = False
         self._new_project_type: Optional[str] = None
         self._new_project_path: Optional[str] = None
+        self._row_labels: dict[str, str] = {}  # Row id -> label it was last given
+        self._widgets: dict = {}  # Handles to composed widgets, filled on mount
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -174,6 +220,8 @@ class LauncherScreen(Screen):
             # Project selection section
             with VerticalScroll(id="project-section"):
                 yield RadioSet(id="project-radio-set")
+                # Loading / empty-state message, shown until rows are in
+                yield Static("Loading projects...", id="list-placeholder", classes="no-projects")
 
             # Action buttons
             with Horizontal(id="button-bar"):
@@ -207,63 +255,103 @@ class LauncherScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Load projects and display them."""
+        """Cache the widgets the screen updates, then load projects."""
+        self._widgets = {
+            "project_radio_set": self.query_one("#project-radio-set", RadioSet),
+            "list_placeholder": self.query_one("#list-placeholder", Static),
+            "new_project_section": self.query_one("#new-project-section"),
+            "type_radio_set": self.query_one("#type-radio-set", RadioSet),
+            "path_section": self.query_one("#path-section"),
+            "path_input": self.query_one("#path-input", Input),
+            "name_section": self.query_one("#name-section"),
+            "name_input": self.query_one("#name-input", Input),
+        }
         self._load_projects()
 
     def _load_projects(self) -> None:
         """Load and display projects."""
-        try:
-            from ralph.storage import get_projects_by_recent
-            self._projects = get_projects_by_recent()
-        except ImportError:
-            self._projects = list_projects()
+        from ralph.storage import get_projects_by_recent
+
+        self._projects = get_projects_by_recent()
 
         self._update_project_list()
 
     def _update_project_list(self) -> None:
         """Update the radio button list of projects."""
-        radio_set = self.query_one("#project-radio-set", RadioSet)
-
-        # Clear all existing children
-        for child in list(radio_set.children):
-            child.remove()
-
-        if not self._projects:
-            radio_set.mount(Static("No projects yet. Click 'New' to create one.", classes="no-projects"))
+        self._rebuild_project_list(self._projects[:9])
+
+    @work(exclusive=True, group="project-list")
+    async def _rebuild_project_list(self, projects: list[Project]) -> None:
+        """Bring the project rows in line with `projects`, one row at a time.
+
+        Rows that already exist are kept (relabelled or moved if needed), so a
+        reload after a create or delete only mounts and removes the difference.
+        Task counts for all rows are read in one thread call so slow trees
+        don't block the UI, and a newer rebuild cancels this one.
+        """
+        radio_set = self._widgets["project_radio_set"]
+        placeholder = self._widgets["list_placeholder"]
+
+        # Drop rows that are no longer wanted, and wait so their ids can be
+        # reused
+        wanted = {f"project-{project.id}" for project in projects}
+        stale = [child for child in radio_set.children if child.id not in wanted]
+        if stale:
+            await radio_set.remove_children(stale)
+        for row_id in set(self._row_labels) - wanted:
+            del self._row_labels[row_id]
+
+        if not projects:
+            placeholder.update("No projects yet. Click 'New' to create one.")
+            placeholder.display = True
             return
 
-        # Add radio buttons for each project
-        for project in self._projects[:9]:
-            # Get progress info
-            try:
-                tree = load_tree(project.id)
-                if tree:
-                    stats = count_tasks(tree)
-                    progress = f"{stats.done}/{stats.total} tasks ({stats.progress_percent:.0f}%)"
-                else:
-                    progress = "No tasks yet"
-            except Exception:
-                progress = "Error loading"
+        rows = {child.id: child for child in radio_set.children}
+        if not rows:
+            placeholder.update("Loading projects...")
+            placeholder.display = True
+
+        progress_by_id = await asyncio.to_thread(
+            _projects_progress, [project.id for project in projects]
+        )
+        placeholder.display = False
+        for index, project in enumerate(projects):
+            progress = progress_by_id[project.id]
 
-            # Create radio button with project info
+            # Create (or update) the radio button with project info
+            row_id = f"project-{project.id}"
             label = f"{project.name}  ({progress})\n      {project.path}"
-            radio_set.mount(RadioButton(label, id=f"project-{project.id}"))
+            row = rows.get(row_id)
+            if row is None:
+                row = ProjectRadioButton(label, project)
+                if index < len(radio_set.children):
+                    await radio_set.mount(row, before=index)
+                else:
+                    await radio_set.mount(row)
+            else:
+                row.project = project
+                if self._row_labels.get(row_id) != label:
+                    row.label = label
+                if radio_set.children[index] is not row:
+                    radio_set.move_child(row, before=index)
+            self._row_labels[row_id] = label
 
         # Focus the radio set (defer to avoid issues during recomposition)
         self.call_later(radio_set.focus)
 
     def _get_selected_project(self) -> Optional[Project]:
         """Get the currently selected project."""
-        radio_set = self.query_one("#project-radio-set", RadioSet)
-        if radio_set.pressed_button is None:
+        radio_set = self._widgets["project_radio_set"]
+        button = radio_set.pressed_button
+        if not isinstance(button, ProjectRadioButton):
             return None
 
-        button_id = radio_set.pressed_button.id
-        if button_id and button_id.startswith("project-"):
-            project_id = button_id[8:]  # Remove "project-" prefix
-            for project in self._projects:
-                if project.id == project_id:
-                    return project
+        # pressed_button can still be a row removed by the last rebuild, so
+        # only trust projects that are still listed
+        project_id = button.project.id
+        for project in self._projects:
+            if project.id == project_id:
+                return project
         return None
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -293,9 +381,9 @@ class LauncherScreen(Screen):
                 self._new_project_type = "brownfield"
 
             # Show path section
-            path_section = self.query_one("#path-section")
+            path_section = self._widgets["path_section"]
             path_section.add_class("visible")
-            self.query_one("#path-input", Input).focus()
+            self._widgets["path_input"].focus()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle input submission."""
@@ -310,34 +398,42 @@ class LauncherScreen(Screen):
             self.notify("Please enter a path", severity="warning")
             return
 
-        path = Path(path_str)
+        abs_path = os.path.abspath(path_str)
 
         if self._new_project_type == "brownfield":
-            if not path.exists():
+            # One stat answers both "exists?" and "is it a directory?"
+            try:
+                st = os.stat(abs_path)
+            except FileNotFoundError:
                 self.notify(f"Path does not exist: {path_str}", severity="error")
                 return
-            if not path.is_dir():
+            except OSError as e:
+                self.notify(f"Cannot access: {e}", severity="error")
+                return
+            if not stat.S_ISDIR(st.st_mode):
                 self.notify("Path must be a directory", severity="error")
                 return
 
-        self._new_project_path = str(path.absolute())
+        self._new_project_path = abs_path
 
         # Show name section with default
-        name_section = self.query_one("#name-section")
+        name_section = self._widgets["name_section"]
         name_section.add_class("visible")
 
-        name_input = self.query_one("#name-input", Input)
-        name_input.placeholder = f"Project name (default: {path.name})"
+        name_input = self._widgets["name_input"]
+        name_input.placeholder = f"Project name (default: {os.path.basename(abs_path)})"
         name_input.focus()
 
     def _create_project(self) -> None:
         """Create the new project."""
+        from ralph.storage import create_empty_tree, create_project
+
         if not self._new_project_path:
             self.notify("Please enter a path first", severity="warning")
             return
 
         path = Path(self._new_project_path)
-        name_input = self.query_one("#name-input", Input)
+        name_input = self._widgets["name_input"]
         name = name_input.value.strip() if name_input.value.strip() else path.name
 
         try:
@@ -363,11 +459,9 @@ class LauncherScreen(Screen):
 
     def _open_project(self, project: Project) -> None:
         """Open a project."""
-        try:
-            from ralph.storage import update_recent
-            update_recent(project.id)
-        except ImportError:
-            pass
+        from ralph.storage import update_recent
+
+        update_recent(project.id)
 
         self.post_message(ProjectOpened(project.id))
 
@@ -378,16 +472,16 @@ class LauncherScreen(Screen):
         self._new_project_path = None
 
         # Reset and show form
-        self.query_one("#path-section").remove_class("visible")
-        self.query_one("#name-section").remove_class("visible")
-        self.query_one("#path-input", Input).value = ""
-        self.query_one("#name-input", Input).value = ""
+        self._widgets["path_section"].remove_class("visible")
+        self._widgets["name_section"].remove_class("visible")
+        self._widgets["path_input"].value = ""
+        self._widgets["name_input"].value = ""
 
-        new_section = self.query_one("#new-project-section")
+        new_section = self._widgets["new_project_section"]
         new_section.add_class("visible")
 
         # Focus the type selection
-        self.query_one("#type-radio-set", RadioSet).focus()
+        self._widgets["type_radio_set"].focus()
 
     def _hide_new_form(self) -> None:
         """Hide the new project form."""
@@ -395,14 +489,14 @@ class LauncherScreen(Screen):
         self._new_project_type = None
         self._new_project_path = None
 
-        new_section = self.query_one("#new-project-section")
+        new_section = self._widgets["new_project_section"]
         new_section.remove_class("visible")
 
-        self.query_one("#path-section").remove_class("visible")
-        self.query_one("#name-section").remove_class("visible")
+        self._widgets["path_section"].remove_class("visible")
+        self._widgets["name_section"].remove_class("visible")
 
         # Re-focus project list
-        self.query_one("#project-radio-set", RadioSet).focus()
+        self._widgets["project_radio_set"].focus()
 
     # Actions
 
@@ -444,4 +538,4 @@ class LauncherScreen(Screen):
         self.app.exit()
 
 
-__all__ = ["LauncherScreen", "ProjectOpened"]
+__all__ = ["LauncherScreen", "ProjectOpened", "ProjectRadioButton"]
@@ -4,27 +4,140 @@ Handles pulling Ollama models and indexing the codebase when Local AI is selecte
 Shows real-time progress bars and status updates.
 """
 
+import functools
+import os
 import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
+import orjson
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.message import Message
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Header, Label, ProgressBar, Static
 
+from ralph.global_config import get_config_dir
 from ralph.models import AIConfig, AIProvider
 from ralph.tui.widgets import Spinner
 
 if TYPE_CHECKING:
     from ralph.tui.app import RalphApp
 
+# Seconds to wait for Ollama to answer a model listing
+OLLAMA_LIST_TIMEOUT = 10.0
+
+# Seconds over which log lines and progress updates are coalesced
+UI_FLUSH_INTERVAL = 0.1
+
+# Seconds a successful setup is trusted before the checks run again
+SETUP_CACHE_TTL = 24 * 60 * 60
+
+# Project files (besides the folder itself) whose change invalidates a cached setup
+_FINGERPRINT_FILES = (os.path.join(".git", "index"), "requirements.txt", "pyproject.toml")
+
+
+@functools.lru_cache(maxsize=1)
+def _ollama():
+    """Import the ollama package on first use."""
+    import ollama
+    return ollama
+
+
+def _response_models(response) -> list:
+    """Get the model entries from an ollama.list() response.
+
+    Newer clients return an object with a ``models`` attribute, older ones a dict.
+    """
+    try:
+        return response.models
+    except AttributeError:
+        return response.get("models", []) or []
+
+
+def _setup_state_file() -> Path:
+    """Path of the persisted fingerprints of completed setups."""
+    return get_config_dir() / "cache" / "local-ai-setup.json"
+
+
+def _setup_fingerprint(ai_config: AIConfig, project_path: str, models: list[str]) -> list:
+    """Describe what a setup run depended on; a change means it must run again.
+
+    Args:
+        ai_config: The AI configuration the setup ran with.
+        project_path: The project that was indexed.
+        models: Full names of the installed models the setup needs.
+    """
+    stats = []
+    for path in (project_path, *(os.path.join(project_path, name) for name in _FINGERPRINT_FILES)):
+        try:
+            st = os.stat(path)
+            stats.append([st.st_mtime_ns, st.st_size])
+        except OSError:
+            stats.append(None)
+    return [ai_config.model_dump(mode="json"), sorted(models), stats]
+
+
+def _load_setup_state() -> dict:
+    """Load setup fingerprints keyed by project path."""
+    try:
+        return orjson.loads(_setup_state_file().read_bytes())
+    except (OSError, ValueError):
+        return {}  # Missing or corrupt state just means "run setup"
+
+
+def _setup_is_cached(ai_config: AIConfig, project_path: str, models: list[str]) -> bool:
+    """Check whether setup already succeeded for this config, models and project state."""
+    entry = _load_setup_state().get(project_path)
+    if not isinstance(entry, dict) or time.time() - entry.get("ts", 0) >= SETUP_CACHE_TTL:
+        return False
+    return entry.get("fingerprint") == _setup_fingerprint(ai_config, project_path, models)
+
+
+def _record_setup(ai_config: AIConfig, project_path: str, models: list[str]) -> None:
+    """Remember a successful setup (best effort, it only saves time)."""
+    from ralph.storage import atomic_write_bytes
+
+    state = _load_setup_state()
+    state[project_path] = {
+        "ts": time.time(),
+        "fingerprint": _setup_fingerprint(ai_config, project_path, models),
+    }
+    try:
+        state_file = _setup_state_file()
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(state_file, orjson.dumps(state, option=orjson.OPT_INDENT_2))
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def _context_engine_cls():
+    """Import ContextEngine on first use (pulls in the indexing stack)."""
+    from ralph.context import ContextEngine
+    return ContextEngine
+
 
 class SetupComplete(Message):
     """Message sent when setup is complete."""
     pass
 
 
+class StepStateChanged(Message):
+    """Message sent by the setup worker when a step changes state."""
+    def __init__(self, step: str, state: str, status_text: str, detail: str) -> None:
+        self.step = step
+        self.state = state
+        self.status_text = status_text
+        self.detail = detail
+        super().__init__()
+
+
 class LocalAISetupScreen(Screen):
     """Screen for setting up Local AI (pulling models, indexing)."""
 
@@ -180,10 +293,28 @@ class LocalAISetupScreen(Screen):
         super().__init__()
         self._ai_config = ai_config
         self._project_path = project_path
-        self._setup_thread: Optional[threading.Thread] = None
+        # Fixed for the life of the screen, so resolved once up front
+        self._required_models = self._compute_required(ai_config)
+        self._will_index = ai_config.context == AIProvider.LOCAL
+        self._steps = ("ollama", "models", "index") if self._will_index else ("ollama", "models")
         self._is_running = False
         self._is_complete = False
-        self._log_lines: list[str] = []
+        self._log_lines: deque[str] = deque(maxlen=20)  # Keeps only the last 20 lines
+        # Log/progress updates buffered by the setup thread until the next flush
+        self._log_lock = threading.Lock()
+        self._log_dirty = False
+        self._pending_progress: dict[str, tuple[int, int]] = {}
+        # Last values the worker sent, so repeats can be dropped at the source
+        self._last_step_state: dict[str, tuple[str, str, str]] = {}
+        self._last_progress: dict[str, tuple[int, int]] = {}
+        self._widgets: dict = {}  # Handles to composed widgets, filled on mount
+        self._step_updaters: dict = {}  # Step -> updater bound to its widgets
+        self._log_flush_pending = False
+        self._ollama_client = None
+        self._ollama_list_response = None  # Reused by _ensure_models
+        # Per-model (status, completed, total) while several pulls run at once
+        self._pull_lock = threading.Lock()
+        self._pull_progress: Optional[dict[str, tuple[str, int, int]]] = None
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -212,15 +343,16 @@ class LocalAISetupScreen(Screen):
                     yield Label("", id="models-detail", classes="step-detail")
                     yield ProgressBar(id="models-progress", total=100, show_eta=False)
 
-                # Step 3: Index codebase
-                with Vertical(id="step-index", classes="step-container"):
-                    with Horizontal(classes="step-header"):
-                        yield Label("3. Index Codebase", classes="step-title")
-                        with Horizontal(classes="status-row"):
-                            yield Spinner(id="index-spinner")
-                            yield Label("Waiting", id="index-status", classes="step-status")
-                    yield Label("", id="index-detail", classes="step-detail")
-                    yield ProgressBar(id="index-progress", total=100, show_eta=False)
+                # Step 3: Index codebase (only if context uses local AI)
+                if self._will_index:
+                    with Vertical(id="step-index", classes="step-container"):
+                        with Horizontal(classes="step-header"):
+                            yield Label("3. Index Codebase", classes="step-title")
+                            with Horizontal(classes="status-row"):
+                                yield Spinner(id="index-spinner")
+                                yield Label("Waiting", id="index-status", classes="step-status")
+                        yield Label("", id="index-detail", classes="step-detail")
+                        yield ProgressBar(id="index-progress", total=100, show_eta=False)
 
                 # Log output
                 with Vertical(id="log-container"):
@@ -235,40 +367,85 @@ class LocalAISetupScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Start setup process when screen mounts."""
+        """Cache the widgets the setup updates, then start the setup process."""
+        widgets = {
+            "overall_progress": self.query_one("#overall-progress", ProgressBar),
+            "log_text": self.query_one("#log-text", Static),
+            "log_scroll": self.query_one("#log-scroll", VerticalScroll),
+            "continue_btn": self.query_one("#continue-btn", Button),
+        }
+        for step in self._steps:
+            widgets[f"{step}_container"] = self.query_one(f"#step-{step}", Vertical)
+            widgets[f"{step}_status"] = self.query_one(f"#{step}-status", Label)
+            widgets[f"{step}_detail"] = self.query_one(f"#{step}-detail", Label)
+            widgets[f"{step}_spinner"] = self.query_one(f"#{step}-spinner", Spinner)
+        for step in self._steps[1:]:
+            widgets[f"{step}_progress"] = self.query_one(f"#{step}-progress", ProgressBar)
+        self._widgets = widgets
+        self._step_updaters = {step: self._make_updater(step) for step in self._steps}
+
         self._start_setup()
 
     def _log(self, message: str) -> None:
-        """Add a log message."""
-        self._log_lines.append(message)
-        # Keep only last 20 lines
-        if len(self._log_lines) > 20:
-            self._log_lines = self._log_lines[-20:]
-        self.app.call_from_thread(self._update_log)
+        """Add a log message (call from thread)."""
+        with self._log_lock:
+            self._log_lines.append(message)
+            self._log_dirty = True
+        self._request_flush()
+
+    def _request_flush(self) -> None:
+        """Schedule a flush of buffered updates unless one is already due."""
+        with self._log_lock:
+            if self._log_flush_pending:
+                return
+            self._log_flush_pending = True
+        self.app.call_from_thread(self._maybe_flush_log)
+
+    def _maybe_flush_log(self) -> None:
+        """Arm the flush timer (main thread) so rapid updates collapse into one."""
+        self.set_timer(UI_FLUSH_INTERVAL, self._update_log)
 
     def _update_log(self) -> None:
-        """Update log display (must be called from main thread)."""
+        """Apply buffered log lines and progress (must be called from main thread)."""
+        with self._log_lock:
+            self._log_flush_pending = False
+            text = "\n".join(self._log_lines) if self._log_dirty else None
+            self._log_dirty = False
+            progress, self._pending_progress = self._pending_progress, {}
+
+        for step, (current, total) in progress.items():
+            self._do_set_progress(step, current, total)
+
+        if text is None:
+            return
         try:
-            log_text = self.query_one("#log-text", Static)
-            log_text.update("\n".join(self._log_lines))
+            self._widgets["log_text"].update(text)
             # Scroll to bottom
-            scroll = self.query_one("#log-scroll", VerticalScroll)
-            scroll.scroll_end(animate=False)
+            self._widgets["log_scroll"].scroll_end(animate=False)
         except Exception:
             pass
 
     def _set_step_state(self, step: str, state: str, status_text: str, detail: str = "") -> None:
         """Update a step's visual state (call from thread)."""
-        self.app.call_from_thread(self._do_set_step_state, step, state, status_text, detail)
-
-    def _do_set_step_state(self, step: str, state: str, status_text: str, detail: str) -> None:
-        """Update step state (must be called from main thread)."""
-        try:
-            container = self.query_one(f"#step-{step}", Vertical)
-            status_label = self.query_one(f"#{step}-status", Label)
-            detail_label = self.query_one(f"#{step}-detail", Label)
-            spinner = self.query_one(f"#{step}-spinner", Spinner)
-
+        key = (state, status_text, detail)
+        if self._last_step_state.get(step) == key:
+            return
+        self._last_step_state[step] = key
+        self.post_message(StepStateChanged(step, state, status_text, detail))
+
+    def on_step_state_changed(self, message: StepStateChanged) -> None:
+        """Apply a step state posted by the setup worker."""
+        self._step_updaters[message.step](message.state, message.status_text, message.detail)
+
+    def _make_updater(self, step: str) -> Callable[[str, str, str], None]:
+        """Build a function that sets one step's state (run on the main thread)."""
+        widgets = self._widgets
+        container = widgets[f"{step}_container"]
+        status_label = widgets[f"{step}_status"]
+        detail_label = widgets[f"{step}_detail"]
+        spinner = widgets[f"{step}_spinner"]
+
+        def update(state: str, status_text: str, detail: str) -> None:
             # Remove old classes
             container.remove_class("active", "done", "error")
             status_label.remove_class("active", "done", "error")
@@ -287,59 +464,63 @@ class LocalAISetupScreen(Screen):
 
             status_label.update(status_text)
             detail_label.update(detail)
-        except Exception:
-            pass
+
+        return update
 
     def _set_progress(self, step: str, current: int, total: int) -> None:
         """Update progress bar (call from thread)."""
-        self.app.call_from_thread(self._do_set_progress, step, current, total)
+        if self._last_progress.get(step) == (current, total):
+            return
+        self._last_progress[step] = (current, total)
+        # Only the latest value per step is applied at the next flush
+        with self._log_lock:
+            self._pending_progress[step] = (current, total)
+        self._request_flush()
 
     def _do_set_progress(self, step: str, current: int, total: int) -> None:
         """Update progress bar (must be called from main thread)."""
         try:
-            progress = self.query_one(f"#{step}-progress", ProgressBar)
+            progress = self._widgets[f"{step}_progress"]
             if total > 0:
                 progress.update(total=total, progress=current)
         except Exception:
             pass
 
     def _enable_continue(self) -> None:
-        """Enable the continue button."""
-        self.app.call_from_thread(self._do_enable_continue)
+        """Enable the continue button (call from thread)."""
+        # Queued behind the worker's earlier step updates, so it lands last
+        self.post_message(SetupComplete())
+
+    def on_setup_complete(self, message: SetupComplete) -> None:
+        """Enable Continue once the setup worker has finished."""
+        self._do_enable_continue()
 
     def _do_enable_continue(self) -> None:
         """Enable continue button (main thread)."""
+        self._update_log()  # Show the final messages without waiting for the timer
         try:
-            btn = self.query_one("#continue-btn", Button)
+            btn = self._widgets["continue_btn"]
             btn.disabled = False
             btn.focus()
         except Exception:
             pass
 
-    def _update_overall_progress(self, completed_steps: int, total_steps: int = 3) -> None:
+    def _update_overall_progress(self, completed_steps: int) -> None:
         """Update overall progress (call from thread)."""
-        pct = int(completed_steps / total_steps * 100)
-        self.app.call_from_thread(self._do_update_overall, pct)
-
-    def _do_update_overall(self, pct: int) -> None:
-        """Update overall progress bar (main thread)."""
-        try:
-            progress = self.query_one("#overall-progress", ProgressBar)
-            progress.update(progress=pct)
-        except Exception:
-            pass
+        pct = int(completed_steps / len(self._steps) * 100)
+        self._set_progress("overall", pct, 100)
 
     def _start_setup(self) -> None:
-        """Start the setup process in a background thread."""
+        """Start the setup process in a background worker."""
         if self._is_running:
             return
 
         self._is_running = True
-        self._setup_thread = threading.Thread(target=self._run_setup, daemon=True)
-        self._setup_thread.start()
+        self._run_setup()
 
+    @work(exclusive=True, thread=True, group="local-ai-setup")
     def _run_setup(self) -> None:
-        """Run the setup steps (in background thread)."""
+        """Run the setup steps (in a worker thread)."""
         try:
             # Step 1: Check Ollama
             self._update_overall_progress(0)
@@ -356,6 +537,21 @@ class LocalAISetupScreen(Screen):
             self._set_step_state("ollama", "done", "Ready", "Ollama is running")
             self._update_overall_progress(1)
 
+            # Ollama is up and nothing else changed since the last successful
+            # run, so the model pulls and indexing can be skipped
+            if self._models_present() and _setup_is_cached(
+                self._ai_config,
+                self._project_path,
+                self._installed_required(self._ollama_list_response),
+            ):
+                for step in self._steps[1:]:
+                    self._set_step_state(step, "done", "Cached", "Unchanged since last setup")
+                    self._set_progress(step, 100, 100)
+                self._update_overall_progress(len(self._steps))
+                self._log("Setup unchanged since last run, skipping model and index checks")
+                self._finish_setup(success=True)
+                return
+
             # Step 2: Pull models if needed
             self._set_step_state("models", "active", "Checking...", "Checking installed models")
             models_ok = self._ensure_models()
@@ -370,7 +566,7 @@ class LocalAISetupScreen(Screen):
             self._update_overall_progress(2)
 
             # Step 3: Index codebase (only if context uses local AI)
-            if self._ai_config.context == AIProvider.LOCAL:
+            if self._will_index:
                 self._set_step_state("index", "active", "Starting...", "Preparing to index")
                 self._set_progress("index", 0, 100)
                 index_ok = self._index_codebase()
@@ -382,42 +578,43 @@ class LocalAISetupScreen(Screen):
 
                 self._set_step_state("index", "done", "Complete", "Codebase indexed")
                 self._set_progress("index", 100, 100)
-            else:
-                self._set_step_state("index", "done", "Skipped", "Using Claude for context")
 
-            self._update_overall_progress(3)
+            self._update_overall_progress(len(self._steps))
+            try:
+                # Re-list: the pulls above may have installed or updated models
+                models = self._installed_required(self._get_ollama_client().list())
+            except Exception:
+                models = None
+            if models is not None:
+                _record_setup(self._ai_config, self._project_path, models)
             self._finish_setup(success=True)
 
         except Exception as e:
             self._log(f"ERROR: {e}")
             self._finish_setup(success=False)
 
+    def _get_ollama_client(self):
+        """Get the shared Ollama client, creating it on first use."""
+        if self._ollama_client is None:
+            self._ollama_client = _ollama().Client(timeout=OLLAMA_LIST_TIMEOUT)
+        return self._ollama_client
+
     def _check_ollama(self) -> bool:
         """Check if Ollama is available."""
         try:
-            import ollama
-            from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-
-            def do_list():
-                return ollama.list()
-
-            # Use thread pool with timeout to avoid hanging
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(do_list)
-                try:
-                    response = future.result(timeout=10)  # 10 second timeout
-                except FuturesTimeoutError:
-                    self._log("ERROR: Ollama not responding (timeout)")
-                    self._log("Make sure Ollama is running: ollama serve")
-                    return False
+            import httpx
+
+            # The client's own socket timeout keeps a hung daemon from blocking us
+            try:
+                response = self._get_ollama_client().list()
+            except httpx.TimeoutException:
+                self._log("ERROR: Ollama not responding (timeout)")
+                self._log("Make sure Ollama is running: ollama serve")
+                return False
 
-            # Count models
-            if hasattr(response, 'models'):
-                count = len(response.models)
-            else:
-                count = len(response.get("models", []))
+            self._ollama_list_response = response
 
-            self._log(f"Ollama connected: {count} models installed")
+            self._log(f"Ollama connected: {len(_response_models(response))} models installed")
             return True
         except ImportError:
             self._log("ERROR: ollama package not installed")
@@ -427,52 +624,51 @@ class LocalAISetupScreen(Screen):
             self._log(f"ERROR: Cannot connect to Ollama: {e}")
             return False
 
+    def _models_present(self) -> bool:
+        """Check the listing from _check_ollama for every required model."""
+        if self._ollama_list_response is None:
+            return False
+        installed = self._extract_installed(self._ollama_list_response)
+        return all(model in installed for model in self._required_models)
+
+    def _installed_required(self, response) -> list[str]:
+        """Full names (with tag) of the installed models this setup needs."""
+        return [
+            name
+            for m in _response_models(response)
+            if (name := getattr(m, "model", None) or m.get("name", ""))
+            and name.split(":", 1)[0] in self._required_models
+        ]
+
     def _ensure_models(self) -> bool:
         """Ensure required models are installed, pull if missing."""
         try:
-            import ollama
-            from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-
-            # Get list of installed models with timeout
-            def do_list():
-                return ollama.list()
-
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(do_list)
-                try:
-                    response = future.result(timeout=10)
-                except FuturesTimeoutError:
-                    self._log("ERROR: Ollama not responding")
-                    return False
+            # Reuse the listing fetched by _check_ollama moments ago
+            response = self._ollama_list_response
+            if response is None:
+                response = self._get_ollama_client().list()
 
-            if hasattr(response, 'models'):
-                installed = [m.model.split(":")[0] for m in response.models if hasattr(m, 'model')]
-            else:
-                installed = [m.get("name", "").split(":")[0] for m in response.get("models", [])]
-
-            self._log(f"Installed models: {', '.join(installed) if installed else 'none'}")
+            installed = self._extract_installed(response)
 
-            # Determine required models based on config
-            required = []
-            if self._ai_config.context == AIProvider.LOCAL:
-                required.append("nomic-embed-text")
-            if self._ai_config.planning == AIProvider.LOCAL or self._ai_config.coding == AIProvider.LOCAL:
-                # Use the configured model or default
-                model_base = self._ai_config.local_model.split(":")[0] if self._ai_config.local_model else "qwen2.5-coder"
-                required.append(model_base)
+            self._log(f"Installed models: {', '.join(sorted(installed)) if installed else 'none'}")
 
+            required = self._required_models
             if not required:
                 self._log("No models required")
                 return True
 
             self._log(f"Required models: {', '.join(required)}")
 
+            missing = [model for model in required if model not in installed]
+            if not missing:
+                self._log(f"All {len(required)} models present")
+                return True
+
             # Pull missing models with streaming progress
-            for model in required:
-                if model in installed:
-                    self._log(f"  {model}: already installed")
-                    continue
+            if len(missing) > 1:
+                return self._pull_models_parallel(missing)
 
+            for model in missing:
                 self._log(f"  {model}: pulling...")
                 self._set_step_state("models", "active", "Pulling...", f"Downloading {model}")
                 self._set_progress("models", 0, 100)
@@ -488,72 +684,171 @@ class LocalAISetupScreen(Screen):
             self._log(f"ERROR checking models: {e}")
             return False
 
+    @staticmethod
+    def _compute_required(ai_config: AIConfig) -> tuple[str, ...]:
+        """Determine the model base names the config needs, in pull order."""
+        required = []
+        if ai_config.context == AIProvider.LOCAL:
+            required.append("nomic-embed-text")
+        if ai_config.planning == AIProvider.LOCAL or ai_config.coding == AIProvider.LOCAL:
+            # Use the configured model or default
+            model_base = ai_config.local_model.split(":")[0] if ai_config.local_model else "qwen2.5-coder"
+            required.append(model_base)
+        return tuple(required)
+
+    @staticmethod
+    def _extract_installed(response) -> set[str]:
+        """Get the base names of installed models from an ollama.list() response."""
+        return {
+            name.split(":", 1)[0]
+            for m in _response_models(response)
+            if (name := getattr(m, "model", None) or m.get("name", ""))
+        }
+
     def _pull_model_streaming(self, model_name: str) -> bool:
         """Pull a model with streaming progress updates."""
         try:
-            import ollama
+            ollama = _ollama()
 
             last_status = ""
+            last_pct = -1
+            last_emit = 0.0
+            last_total = 0
+            total_mb_str = ""
+            last_size = (-1, "")  # (MB downloaded, status) shown in detail
+            detail = ""
             for progress in ollama.pull(model_name, stream=True):
                 status = progress.get('status', '')
                 completed = progress.get('completed', 0)
                 total = progress.get('total', 0)
 
                 if total > 0:
-                    # Downloading - show byte progress
-                    pct = int(completed / total * 100)
-                    size_mb = completed / 1024 / 1024
-                    total_mb = total / 1024 / 1024
-                    detail = f"{status}: {size_mb:.0f}MB / {total_mb:.0f}MB"
+                    # Downloading - show byte progress, but only when the
+                    # percentage moves or the display has gone stale
+                    pct = completed * 100 // total
+                    now = time.monotonic()
+                    if pct == last_pct and now - last_emit <= UI_FLUSH_INTERVAL:
+                        continue
+                    last_pct = pct
+                    last_emit = now
+                    if total != last_total:
+                        last_total = total
+                        total_mb_str = f"{total >> 20}MB"
+                    size = (completed >> 20, status)
+                    if self._pull_progress is not None:
+                        self._report_combined_progress(model_name, status, completed, total)
+                        continue
+                    if size != last_size:
+                        last_size = size
+                        detail = f"{status}: {size[0]}MB / {total_mb_str}"
                     self._set_step_state("models", "active", f"{pct}%", detail)
                     self._set_progress("models", completed, total)
                 else:
                     # Other status (pulling manifest, verifying, etc)
                     if status != last_status:
-                        self._set_step_state("models", "active", "Working...", status)
                         last_status = status
+                        if self._pull_progress is not None:
+                            self._report_combined_progress(model_name, status, 0, 0)
+                        else:
+                            self._set_step_state("models", "active", "Working...", status)
 
+            from ralph.tui.screens.ai_config import invalidate_ollama_cache
+            invalidate_ollama_cache()  # Installed model list has changed
             return True
 
         except Exception as e:
             self._log(f"ERROR pulling {model_name}: {e}")
             return False
 
+    def _pull_models_parallel(self, models: list[str]) -> bool:
+        """Pull several models at once, showing their combined progress."""
+        for model in models:
+            self._log(f"  {model}: pulling...")
+        self._set_step_state("models", "active", "Pulling...", f"Downloading {', '.join(models)}")
+        self._set_progress("models", 0, 100)
+
+        self._pull_progress = {model: ("waiting", 0, 0) for model in models}
+        try:
+            with ThreadPoolExecutor(max_workers=len(models), thread_name_prefix="ollama-pull") as executor:
+                results = list(executor.map(self._pull_model_streaming, models))
+        finally:
+            self._pull_progress = None
+
+        for model, ok in zip(models, results):
+            if ok:
+                self._log(f"  {model}: installed")
+        return all(results)
+
+    def _report_combined_progress(self, model_name: str, status: str, completed: int, total: int) -> None:
+        """Record one pull's progress and show the sum across all pulls (call from thread)."""
+        with self._pull_lock:
+            if total:
+                self._pull_progress[model_name] = (status, completed, total)
+            else:
+                # Keep the bytes already counted so the combined bar doesn't drop back
+                _, completed, total = self._pull_progress[model_name]
+                self._pull_progress[model_name] = (status, completed, total)
+            entries = list(self._pull_progress.items())
+
+        all_completed = sum(completed for _, (_, completed, _) in entries)
+        all_total = sum(total for _, (_, _, total) in entries)
+        detail = " | ".join(
+            f"{model}: {completed >> 20}/{total >> 20}MB" if status.startswith("pulling") and total
+            else f"{model}: {status}"
+            for model, (status, completed, total) in entries
+        )
+        if all_total:
+            self._set_step_state("models", "active", f"{all_completed * 100 // all_total}%", detail)
+            self._set_progress("models", all_completed, all_total)
+        else:
+            self._set_step_state("models", "active", "Working...", detail)
+
     def _index_codebase(self) -> bool:
         """Index the codebase for context retrieval with progress."""
         try:
-            from ralph.context import ContextEngine
+            ContextEngine = _context_engine_cls()
 
             self._log(f"Indexing: {self._project_path}")
 
             engine = ContextEngine(self._project_path)
 
-            # Check existing index
-            status = engine.status()
-            if status.get("indexed_files", 0) > 0:
-                self._log(f"Existing index: {status['indexed_files']} files, {status['total_chunks']} chunks")
+            # Check existing index (file count only; opening ChromaDB is left to index())
+            indexed_files = engine.quick_stats()["indexed_files"]
+            if indexed_files > 0:
+                self._log(f"Existing index: {indexed_files} files")
+
+            # Define progress callback; called once per file, so the display
+            # is only refreshed when the percentage moves or has gone stale
+            last_pct = -1
+            last_emit = 0.0
 
-            # Define progress callback
             def on_progress(current: int, total: int, filepath: str, status: str):
-                if total > 0:
-                    pct = int(current / total * 100) if total > 0 else 0
+                nonlocal last_pct, last_emit
+                if total <= 0:
+                    return
 
-                    # Truncate filepath for display
-                    if len(filepath) > 50:
-                        display_path = "..." + filepath[-47:]
-                    else:
-                        display_path = filepath
+                # Log every 50 files
+                if current > 0 and current % 50 == 0:
+                    self._log(f"  Indexed {current}/{total} files...")
 
-                    if status == "indexing":
-                        self._set_step_state("index", "active", f"{pct}%", display_path)
-                        self._set_progress("index", current, total)
-                    elif status == "complete":
-                        self._set_step_state("index", "active", "100%", "Finalizing...")
-                        self._set_progress("index", total, total)
+                if status == "complete":
+                    self._set_step_state("index", "active", "100%", "Finalizing...")
+                    self._set_progress("index", total, total)
+                    return
+                if status != "indexing":
+                    return
+
+                pct = current * 100 // total
+                now = time.monotonic()
+                if pct == last_pct and now - last_emit < UI_FLUSH_INTERVAL:
+                    return
+                last_pct = pct
+                last_emit = now
 
-                    # Log every 50 files
-                    if current > 0 and current % 50 == 0:
-                        self._log(f"  Indexed {current}/{total} files...")
+                # Truncate filepath for display
+                display_path = filepath if len(filepath) <= 50 else "..." + filepath[-47:]
+                self._set_step_state("index", "active", f"{pct}%", display_path)
+                self._set_progress("index", current, total)
 
             # Run indexing with progress callback
             result = engine.index(force=False, verbose=False, progress_callback=on_progress)
@@ -611,4 +906,4 @@ class LocalAISetupScreen(Screen):
         app._push_main_screen()
 
 
-__all__ = ["LocalAISetupScreen", "SetupComplete"]
+__all__ = ["LocalAISetupScreen", "SetupComplete", "StepStateChanged"]
@@ -4,12 +4,15 @@ The MainScreen provides the primary interface for task management,
 featuring a split layout with terminal, tree view, and task details.
 """
 
-from typing import TYPE_CHECKING
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
 
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.message import Message
 from textual.screen import Screen, ModalScreen
+from textual.timer import Timer
 from textual.widgets import (
     Footer,
     Header,
@@ -22,13 +25,38 @@ from textual.widgets import (
 )
 
 from ralph.tui.widgets import TaskTreeWidget, TaskPanel, StatusPanel, TerminalWidget
-from ralph.storage import load_tree, load_workers
-from ralph.core import count_tasks, find_n_tasks
+from ralph.models import TaskNode, Tree, TreeStats, Worker, WorkerList
+from ralph.storage import get_workers_signature, load_workers, save_workers
+from ralph.core import count_tasks, create_worker, estimate_tokens, find_n_tasks, find_task_by_path
 
 if TYPE_CHECKING:
     from ralph.tui.app import RalphApp
 
 
+# (section title, ((key, description), ...)) rows shown by HelpModal
+_HELP_SECTIONS = (
+    ("Task Management", (
+        ("n", "Start next pending task"),
+        ("d", "Mark selected task as done"),
+        ("v", "Run acceptance criteria"),
+        ("a", "Assign parallel workers"),
+        ("r", "Refresh tree view"),
+    )),
+    ("Navigation", (
+        ("Tab", "Move focus to next widget"),
+        ("Shift+Tab", "Move focus to previous widget"),
+        ("Up/Down", "Navigate tree/lists"),
+        ("Enter", "Select/expand item"),
+    )),
+    ("Application", (
+        ("Ctrl+P", "Open command palette"),
+        ("?", "Show this help"),
+        ("q", "Quit application"),
+        ("Escape", "Close modal/focus terminal"),
+    )),
+)
+
+
 class TaskSelected(Message):
     """Message sent when a task is selected in the tree."""
 
@@ -59,6 +87,22 @@ class MainScreen(Screen):
         ("escape", "app.focus('terminal')", "Focus Terminal"),
     ]
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._widgets: dict = {}  # Handles to composed widgets, filled on mount
+        self._stats_cache: Optional[tuple[Tree, TreeStats]] = None  # Counts for the cached tree
+        # Path tuple -> node for the cached tree, built on first selection
+        self._path_index: Optional[tuple[Tree, dict[tuple[str, ...], TaskNode]]] = None
+        # Pending trailing-edge refresh: data reload and/or task panel selection
+        self._refresh_pending = False
+        self._pending_selection: Optional[list[str]] = None
+        self._refresh_timer: Optional[Timer] = None
+        # Last values pushed to the status panel, to skip no-op updates
+        self._last_stats: Optional[TreeStats] = None
+        self._last_workers_sig: Optional[tuple] = None
+        # (project_id, app tree, workers.json signature) last refreshed
+        self._refresh_sig: Optional[tuple[str, Optional[Tree], Optional[tuple[int, int]]]] = None
+
     def compose(self) -> ComposeResult:
         """Compose the main screen layout."""
         yield Header()
@@ -85,61 +129,143 @@ class MainScreen(Screen):
 
     def on_mount(self) -> None:
         """Handle screen mount - initialize widgets with data."""
+        self._widgets = {
+            "task_tree": self.query_one("#task-tree", TaskTreeWidget),
+            "status_panel": self.query_one("#status-panel", StatusPanel),
+            "task_panel": self.query_one("#task-panel", TaskPanel),
+        }
         self._refresh_data()
 
+    def _get_tree(self) -> Optional[Tree]:
+        """Get the app's tree, so pending background saves are already visible."""
+        app: RalphApp = self.app  # type: ignore
+        return app.get_tree()
+
+    def _count_tasks(self, tree: Tree) -> TreeStats:
+        """Count tasks, reusing the last counts while the same tree is cached."""
+        if self._stats_cache is not None and self._stats_cache[0] is tree:
+            return self._stats_cache[1]
+        stats = count_tasks(tree)
+        self._stats_cache = (tree, stats)
+        return stats
+
+    def _find_task(self, tree: Tree, path: list[str]) -> Optional[TaskNode]:
+        """Look up a task by path through an index built once per cached tree."""
+        if self._path_index is None or self._path_index[0] is not tree:
+            index: dict[tuple[str, ...], TaskNode] = {}
+            stack = [(child, (tree.name,)) for child in tree.children]
+            while stack:
+                node, parent_path = stack.pop()
+                node_path = parent_path + (node.name,)
+                index[node_path] = node
+                stack.extend((child, node_path) for child in node.children)
+            self._path_index = (tree, index)
+
+        task = self._path_index[1].get(tuple(path))
+        if task is None:
+            # e.g. a path given without the root name prefix
+            task = find_task_by_path(tree, path)
+        return task
+
+    def _schedule_refresh(self, selection: Optional[list[str]] = None) -> None:
+        """Schedule a refresh, coalescing bursts within 50 ms.
+
+        Args:
+            selection: Path of a newly selected task to show in the task
+                panel. When omitted, the tree, stats and workers are reloaded.
+        """
+        if selection is None:
+            self._refresh_pending = True
+        else:
+            self._pending_selection = selection
+        if self._refresh_timer is not None:
+            return
+        self._refresh_timer = self.set_timer(0.05, self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        """Run the refresh work accumulated since the timer was armed."""
+        self._refresh_timer = None
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self._refresh_data()
+        if self._pending_selection is not None:
+            path, self._pending_selection = self._pending_selection, None
+            self._show_task(path)
+
     def _refresh_data(self) -> None:
         """Refresh all widgets with current project data."""
-        app: "RalphApp" = self.app  # type: ignore
+        app: RalphApp = self.app  # type: ignore
 
         if not app.current_project:
             return
 
         project_id = app.current_project.id
+        tree = self._get_tree()
+        workers_signature = get_workers_signature(project_id)
+        last = self._refresh_sig
+        if (
+            last is not None
+            and last[0] == project_id
+            and last[1] is tree
+            and last[2] == workers_signature
+        ):
+            return  # Same tree object and unchanged workers.json
+
+        # Widget handles are cached on mount; nothing to update before that
+        task_tree = self._widgets.get("task_tree")
+        status_panel = self._widgets.get("status_panel")
 
         # Load tree data
-        tree = load_tree(project_id)
+        stats_update: Optional[TreeStats] = None
         if tree:
             # Update tree widget
-            try:
-                tree_widget = self.query_one("#task-tree", TaskTreeWidget)
-                tree_widget.load_tree(tree)
-            except Exception:
-                pass
-
-            # Update status panel
-            try:
-                status_panel = self.query_one("#status-panel", StatusPanel)
-                stats = count_tasks(tree)
-                status_panel.update_stats(stats)
-            except Exception:
-                pass
+            if task_tree is not None:
+                task_tree.load_tree(tree)
+
+            stats = self._count_tasks(tree)
+            if stats != self._last_stats:
+                stats_update = stats
 
         # Load workers
+        workers_update: Optional[list[Worker]] = None
         worker_list = load_workers(project_id)
-        try:
-            status_panel = self.query_one("#status-panel", StatusPanel)
-            status_panel.update_workers(worker_list.workers)
-        except Exception:
-            pass
+        # Only the fields the workers table shows
+        workers_sig = tuple((w.id, w.branch, w.task, w.status) for w in worker_list.workers)
+        if workers_sig != self._last_workers_sig:
+            workers_update = worker_list.workers
+
+        # Update status panel with whatever changed, in one repaint
+        if status_panel is not None and (stats_update is not None or workers_update is not None):
+            status_panel.update_status(stats_update, workers_update)
+            if stats_update is not None:
+                self._last_stats = stats_update
+            if workers_update is not None:
+                self._last_workers_sig = workers_sig
+
+        self._refresh_sig = (project_id, tree, workers_signature)
 
     def on_task_selected(self, event: TaskSelected) -> None:
         """Handle task selection from the tree widget."""
-        app: "RalphApp" = self.app  # type: ignore
+        app: RalphApp = self.app  # type: ignore
 
         # Update app's selected task
         app.selected_task_path = event.path
 
-        # Update task panel
+        # Update task panel once the selection settles
+        self._schedule_refresh(selection=event.path)
+
+    def _show_task(self, path: list[str]) -> None:
+        """Show the task at path in the task panel."""
+        app: RalphApp = self.app  # type: ignore
+
         if app.current_project:
-            tree = load_tree(app.current_project.id)
+            tree = self._get_tree()
             if tree:
                 try:
-                    from ralph.core import find_task_by_path, estimate_tokens
-                    task = find_task_by_path(tree, event.path)
+                    task = self._find_task(tree, path)
                     if task:
-                        task_panel = self.query_one("#task-panel", TaskPanel)
                         estimate = estimate_tokens(task, "")  # No context available here
-                        task_panel.update_task(task, event.path, estimate)
+                        self._widgets["task_panel"].update_task(task, path, estimate)
                 except Exception:
                     pass
 
@@ -151,7 +277,7 @@ class WorkerModal(ModalScreen):
         ("escape", "dismiss", "Close"),
     ]
 
-    CSS = """
+    DEFAULT_CSS = """
     WorkerModal {
         align: center middle;
     }
@@ -209,11 +335,6 @@ class WorkerModal(ModalScreen):
 
     def _assign_workers(self) -> None:
         """Assign workers based on input."""
-        from ralph.tui.app import RalphApp
-        from ralph.storage import save_workers
-        from ralph.core import create_worker
-        from ralph.models import WorkerList
-
         app: RalphApp = self.app  # type: ignore
 
         if not app.current_project:
@@ -231,13 +352,13 @@ class WorkerModal(ModalScreen):
             app.notify("Please enter a valid number", severity="warning")
             return
 
-        tree = load_tree(app.current_project.id)
+        tree = app.get_tree()
         if not tree:
             app.notify("No task tree found", severity="warning")
             self.dismiss()
             return
 
-        # Find available tasks
+        # Find available tasks, shallowest pending first
         tasks = find_n_tasks(tree, count)
         if not tasks:
             app.notify("No pending tasks available", severity="information")
@@ -255,7 +376,7 @@ class WorkerModal(ModalScreen):
         save_workers(app.current_project.id, worker_list)
 
         app.notify(f"Assigned {len(workers)} workers", severity="information")
-        self.dismiss()
+        self.dismiss(True)
 
 
 class HelpModal(ModalScreen):
@@ -266,7 +387,7 @@ class HelpModal(ModalScreen):
         ("question_mark", "dismiss", "Close"),
     ]
 
-    CSS = """
+    DEFAULT_CSS = """
     HelpModal {
         align: center middle;
     }
@@ -316,24 +437,10 @@ class HelpModal(ModalScreen):
         with Container(id="help-modal"):
             yield Label("Ralph TUI - Keyboard Shortcuts", id="help-title")
 
-            yield Label("Task Management", classes="help-section-title")
-            yield self._help_row("n", "Start next pending task")
-            yield self._help_row("d", "Mark selected task as done")
-            yield self._help_row("v", "Run acceptance criteria")
-            yield self._help_row("a", "Assign parallel workers")
-            yield self._help_row("r", "Refresh tree view")
-
-            yield Label("Navigation", classes="help-section-title")
-            yield self._help_row("Tab", "Move focus to next widget")
-            yield self._help_row("Shift+Tab", "Move focus to previous widget")
-            yield self._help_row("Up/Down", "Navigate tree/lists")
-            yield self._help_row("Enter", "Select/expand item")
-
-            yield Label("Application", classes="help-section-title")
-            yield self._help_row("Ctrl+P", "Open command palette")
-            yield self._help_row("?", "Show this help")
-            yield self._help_row("q", "Quit application")
-            yield self._help_row("Escape", "Close modal/focus terminal")
+            for title, rows in _HELP_SECTIONS:
+                yield Label(title, classes="help-section-title")
+                for key, description in rows:
+                    yield self._help_row(key, description)
 
             yield Label("")
             yield Label("Press Escape or ? to close", id="help-footer")
@@ -3,6 +3,8 @@
 Wizard for creating new projects (greenfield or brownfield).
 """
 
+from __future__ import annotations
+
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
@@ -74,7 +76,7 @@ class ProjectTypeCard(Static):
 class NewProjectScreen(Screen):
     """Screen for creating a new project."""
 
-    CSS = """
+    DEFAULT_CSS = """
     NewProjectScreen {
         background: $surface;
     }
@@ -141,6 +143,8 @@ class NewProjectScreen(Screen):
         super().__init__()
         self._project_type: Optional[str] = None
         self._selected_path: Optional[str] = None
+        self._selected_path_obj: Optional[Path] = None  # _selected_path as a Path
+        self._widgets: dict = {}  # Handles to composed widgets, filled on mount
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -187,8 +191,18 @@ class NewProjectScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Focus first card on mount."""
-        self.query_one("#greenfield-card", ProjectTypeCard).focus()
+        """Cache the widgets the wizard updates and focus the first card."""
+        self._widgets = {
+            "greenfield_card": self.query_one("#greenfield-card", ProjectTypeCard),
+            "brownfield_card": self.query_one("#brownfield-card", ProjectTypeCard),
+            "name_section": self.query_one("#name-input-section"),
+            "path_section": self.query_one("#path-display-section"),
+            "project_name_input": self.query_one("#project-name-input", Input),
+            "brownfield_name_input": self.query_one("#brownfield-name-input", Input),
+            "selected_path_label": self.query_one("#selected-path-label", Label),
+            "create_btn": self.query_one("#create-btn", Button),
+        }
+        self._widgets["greenfield_card"].focus()
 
     def on_project_type_card_focus(self, event) -> None:
         """Track which card is focused."""
@@ -198,14 +212,14 @@ class NewProjectScreen(Screen):
         """Select a project type and show appropriate inputs."""
         self._project_type = project_type
 
-        name_section = self.query_one("#name-input-section")
-        path_section = self.query_one("#path-display-section")
-        create_btn = self.query_one("#create-btn", Button)
+        name_section = self._widgets["name_section"]
+        path_section = self._widgets["path_section"]
+        create_btn = self._widgets["create_btn"]
 
         if project_type == "greenfield":
             name_section.add_class("visible")
             path_section.remove_class("visible")
-            self.query_one("#project-name-input", Input).focus()
+            self._widgets["project_name_input"].focus()
             create_btn.disabled = False
         else:  # brownfield
             name_section.remove_class("visible")
@@ -220,12 +234,9 @@ class NewProjectScreen(Screen):
         """Handle key events."""
         if event.key == "enter":
             # Check if a card is focused
-            greenfield = self.query_one("#greenfield-card", ProjectTypeCard)
-            brownfield = self.query_one("#brownfield-card", ProjectTypeCard)
-
-            if greenfield.has_focus:
+            if self._widgets["greenfield_card"].has_focus:
                 self._select_type("greenfield")
-            elif brownfield.has_focus:
+            elif self._widgets["brownfield_card"].has_focus:
                 self._select_type("brownfield")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -244,40 +255,37 @@ class NewProjectScreen(Screen):
         def handle_folder_selection(selected_path: Optional[str]) -> None:
             if selected_path:
                 self._selected_path = selected_path
+                self._selected_path_obj = Path(selected_path)
 
                 # Update display
-                path_label = self.query_one("#selected-path-label", Label)
-                path_label.update(selected_path)
+                self._widgets["selected_path_label"].update(selected_path)
 
                 # Auto-fill name from folder
-                folder_name = Path(selected_path).name
-                name_input = self.query_one("#brownfield-name-input", Input)
-                name_input.value = folder_name
+                folder_name = self._selected_path_obj.name
+                self._widgets["brownfield_name_input"].value = folder_name
 
                 # Enable create button
-                create_btn = self.query_one("#create-btn", Button)
-                create_btn.disabled = False
+                self._widgets["create_btn"].disabled = False
 
         self.app.push_screen(FolderBrowserScreen(), handle_folder_selection)
 
     def _create_project(self) -> None:
         """Create the project."""
         if self._project_type == "greenfield":
-            name_input = self.query_one("#project-name-input", Input)
-            name = name_input.value.strip()
+            name = self._widgets["project_name_input"].value.strip()
             if not name:
                 self.notify("Please enter a project name", severity="warning")
                 return
 
             # Create project in a new folder
-            project_path = str(Path.cwd() / name)
-            Path(project_path).mkdir(parents=True, exist_ok=True)
+            project_dir = Path.cwd() / name
+            project_dir.mkdir(parents=True, exist_ok=True)
+            project_path = str(project_dir)
 
         else:  # brownfield
-            name_input = self.query_one("#brownfield-name-input", Input)
-            name = name_input.value.strip()
+            name = self._widgets["brownfield_name_input"].value.strip()
             if not name:
-                name = Path(self._selected_path).name
+                name = self._selected_path_obj.name
 
             project_path = self._selected_path
 
@@ -299,8 +307,7 @@ class NewProjectScreen(Screen):
 
     def action_confirm(self) -> None:
         """Confirm current selection."""
-        create_btn = self.query_one("#create-btn", Button)
-        if not create_btn.disabled:
+        if not self._widgets["create_btn"].disabled:
             self._create_project()
 
 
@@ -4,8 +4,10 @@ Displayed when multiple projects exist and no specific project is specified.
 Allows users to choose which project to work on.
 """
 
+import asyncio
 from typing import TYPE_CHECKING, Optional
 
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.message import Message
@@ -13,12 +15,26 @@ from textual.screen import ModalScreen, Screen
 from textual.widgets import Button, Footer, Header, Label, ListItem, ListView, Static
 
 from ralph.models import Project, TreeStats
-from ralph.storage import delete_project, load_tree
+from ralph.storage import delete_project, load_task_counts_bulk, load_tree
 from ralph.core import count_tasks
 
 if TYPE_CHECKING:
     from ralph.tui.app import RalphApp
 
+# Project items mounted per batch; more are mounted as the list scrolls
+PROJECT_PAGE_SIZE = 20
+
+
+def _get_stats(project_ids: list[str]) -> dict[str, Optional[TreeStats]]:
+    """Get task counts for a batch of projects, reused while tree.json is unchanged."""
+    counts = load_task_counts_bulk(project_ids)
+    for project_id in project_ids:
+        if project_id not in counts:
+            # tree.json couldn't be counted directly; fall back to the full model
+            tree = load_tree(project_id)
+            counts[project_id] = count_tasks(tree) if tree else None
+    return counts
+
 
 class ProjectSelected(Message):
     """Message sent when a project is selected."""
@@ -205,6 +221,7 @@ class ProjectItem(Static):
         self,
         project: Project,
         stats: Optional[TreeStats] = None,
+        stats_pending: bool = False,
         **kwargs,
     ) -> None:
         """Initialize a project item.
@@ -212,26 +229,48 @@ class ProjectItem(Static):
         Args:
             project: The project to display.
             stats: Optional tree statistics for progress display.
+            stats_pending: Show a loading line until refresh_stats is called.
         """
         super().__init__(**kwargs)
         self.project = project
         self.stats = stats
+        # Not Widget.loading, which would overlay and disable the item
+        self._stats_pending = stats_pending
 
     def compose(self) -> ComposeResult:
         """Compose the project item content."""
         yield Label(self.project.name, classes="project-name")
         yield Label(self.project.path, classes="project-path")
+        text, classes = self._stats_line()
+        yield Label(text, classes=classes)
 
+    def _stats_line(self) -> tuple[str, str]:
+        """Text and classes for the progress line."""
+        if self._stats_pending:
+            return "Loading progress...", "project-stats"
         if self.stats:
             progress = self.stats.progress_percent
             total = self.stats.total
             done = self.stats.done
-            yield Label(
+            return (
                 f"Progress: {done}/{total} tasks ({progress:.1f}%)",
-                classes="project-stats progress-text",
+                "project-stats progress-text",
             )
-        else:
-            yield Label("No task tree configured", classes="project-stats no-tree")
+        return "No task tree configured", "project-stats no-tree"
+
+    def refresh_stats(self, stats: Optional[TreeStats]) -> None:
+        """Show loaded stats, rewriting only the progress line.
+
+        Args:
+            stats: The project's tree statistics, or None if it has no tree.
+        """
+        self.stats = stats
+        self._stats_pending = False
+        text, classes = self._stats_line()
+        # Before compose has run there is no line yet; compose uses the new stats
+        for label in self.query(".project-stats").results(Label):
+            label.update(text)
+            label.set_classes(classes)
 
 
 class ProjectSelectScreen(Screen):
@@ -331,28 +370,66 @@ class ProjectSelectScreen(Screen):
                 self._create_item = create_item
                 yield create_item
 
-                for project in self.projects:
-                    # Load stats if tree exists
-                    stats = None
-                    tree = load_tree(project.id)
-                    if tree:
-                        stats = count_tasks(tree)
-
-                    item = ProjectItem(
-                        project,
-                        stats=stats,
-                        id=f"project-{project.id}",
-                    )
-                    self._project_items.append(item)
-                    yield item
+                # Only the first batch; the rest is mounted on scroll
+                yield from self._next_items()
 
         yield Footer()
 
     def on_mount(self) -> None:
         """Handle mount - focus the create item first."""
+        container = self.query_one("#project-list-container", VerticalScroll)
+        self.watch(container, "scroll_y", self._on_list_scroll, init=False)
+        self.call_after_refresh(self._fill_list)
+
         if self._create_item:
             self._create_item.focus()
 
+    def _next_items(self) -> list[ProjectItem]:
+        """Build the next batch of project items and add them to the list."""
+        start = len(self._project_items)
+        items = []
+        for project in self.projects[start:start + PROJECT_PAGE_SIZE]:
+            items.append(ProjectItem(
+                project,
+                stats_pending=True,
+                id=f"project-{project.id}",
+            ))
+        self._project_items.extend(items)
+        if items:
+            self._load_stats(items)
+        return items
+
+    @work(group="project-stats")
+    async def _load_stats(self, items: list[ProjectItem]) -> None:
+        """Fill in the batch's stats, reading trees in a thread."""
+        counts = await asyncio.to_thread(_get_stats, [item.project.id for item in items])
+        for item in items:
+            item.refresh_stats(counts[item.project.id])
+
+    def _mount_more(self) -> bool:
+        """Mount the next batch of project items.
+
+        Returns:
+            True if any items were mounted.
+        """
+        items = self._next_items()
+        if not items:
+            return False
+        container = self.query_one("#project-list-container", VerticalScroll)
+        container.mount(*items)
+        return True
+
+    def _fill_list(self) -> None:
+        """Mount batches until the list fills the viewport plus one screen."""
+        container = self.query_one("#project-list-container", VerticalScroll)
+        remaining = container.max_scroll_y - container.scroll_y
+        if remaining < container.size.height and self._mount_more():
+            self.call_after_refresh(self._fill_list)
+
+    def _on_list_scroll(self, scroll_y: float) -> None:
+        """Mount more items as the list nears its end."""
+        self._fill_list()
+
     def _get_all_items(self) -> list:
         """Get all focusable items (create item + project items)."""
         items = []
@@ -374,6 +451,8 @@ class ProjectSelectScreen(Screen):
         if self._selected_index < len(all_items) - 1:
             self._selected_index += 1
             all_items[self._selected_index].focus()
+            if self._selected_index == len(all_items) - 1:
+                self._mount_more()  # Keep an item below the cursor
 
     def action_select_project(self) -> None:
         """Select the currently focused project."""
@@ -477,6 +556,7 @@ class ProjectSelectScreen(Screen):
         # Clear and rebuild the list
         container = self.query_one("#project-list-container", VerticalScroll)
         container.remove_children()
+        self.workers.cancel_group(self, "project-stats")
         self._project_items.clear()
         self._selected_index = 0
 
@@ -485,20 +565,9 @@ class ProjectSelectScreen(Screen):
         self._create_item = create_item
         container.mount(create_item)
 
-        # Re-add project items
-        for project in self.projects:
-            stats = None
-            tree = load_tree(project.id)
-            if tree:
-                stats = count_tasks(tree)
-
-            item = ProjectItem(
-                project,
-                stats=stats,
-                id=f"project-{project.id}",
-            )
-            self._project_items.append(item)
-            container.mount(item)
+        # Re-add the first batch of project items
+        container.mount(*self._next_items())
+        self.call_after_refresh(self._fill_list)
 
         # Update subtitle
         subtitle = self.query_one("#project-select-subtitle", Label)
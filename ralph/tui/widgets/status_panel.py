@@ -158,6 +158,23 @@ class StatusPanel(Static):
         self._workers = workers
         self._refresh_workers()
 
+    def update_status(
+        self,
+        stats: Optional[TreeStats] = None,
+        workers: Optional[list[Worker]] = None,
+    ) -> None:
+        """Update stats and workers together in a single repaint.
+
+        Args:
+            stats: The TreeStats to display, or None to leave them as is.
+            workers: List of Worker assignments, or None to leave them as is.
+        """
+        with self.app.batch_update():
+            if stats is not None:
+                self.update_stats(stats)
+            if workers is not None:
+                self.update_workers(workers)
+
     def _refresh_stats(self) -> None:
         """Refresh the stats display."""
         stats = self._stats
@@ -18,6 +18,15 @@ STATUS_ICONS = {
 }
 
 
+def _task_label(task: TaskNode) -> str:
+    """Build the tree label for a task, with its status icon."""
+    icon = STATUS_ICONS.get(task.status, "[ ]")
+    if task.is_leaf():
+        return f"{icon} {task.name}"
+    # Non-leaf nodes show as folders/groups
+    return f"[bold]{icon} {task.name}[/bold]"
+
+
 class TaskSelected(Message):
     """Message posted when a task is selected in the tree."""
 
@@ -60,35 +69,94 @@ class TaskTreeWidget(Tree[TaskNode]):
         super().__init__(label, id=id, classes=classes)
         self._ralph_tree: Optional[RalphTree] = None
         self._task_paths: dict[int, list[str]] = {}  # node_id -> path
+        self._unloaded: set[int] = set()  # node_ids whose children aren't added yet
+        self._labels: dict[int, str] = {}  # node_id -> label markup last set
 
     def load_tree(self, tree: RalphTree) -> None:
         """Load a Ralph tree into the widget.
 
+        Only the first level is added up front; deeper branches are filled
+        in when they are first expanded. Reloading a tree with the same name
+        patches the existing nodes in place, keeping expansion and cursor.
+
         Args:
             tree: The Ralph Tree model to display.
         """
+        previous = self._ralph_tree
         self._ralph_tree = tree
+
+        if previous is not None and previous.name == tree.name:
+            self._patch_children(self.root, tree.children, [tree.name])
+            return
+
         self._task_paths.clear()
+        self._unloaded.clear()
+        self._labels.clear()
         self.clear()
 
         # Set root label with tree name
         self.root.set_label(f"[bold]{tree.name}[/bold]")
         self.root.data = None  # Root doesn't have task data
 
-        # Add children recursively
+        # Add the first level; deeper levels load on expand
         for child in tree.children:
             self._add_task_node(self.root, child, [tree.name])
 
         # Expand the root by default
         self.root.expand()
 
+    def _patch_children(
+        self,
+        parent: TreeNode[TaskNode],
+        tasks: list[TaskNode],
+        parent_path: list[str],
+    ) -> None:
+        """Bring a node's loaded children in line with an updated task list.
+
+        Children matching by position, name and leafness are updated in
+        place; any other difference rebuilds this level.
+
+        Args:
+            parent: The tree node whose children are patched.
+            tasks: The updated child tasks.
+            parent_path: Path to the parent node.
+        """
+        nodes = parent.children
+        if len(nodes) != len(tasks) or any(
+            node.data.name != task.name or node.allow_expand == task.is_leaf()
+            for node, task in zip(nodes, tasks)
+        ):
+            for node in nodes:
+                self._forget_node(node)
+            parent.remove_children()
+            for task in tasks:
+                self._add_task_node(parent, task, parent_path)
+            return
+
+        for node, task in zip(nodes, tasks):
+            node.data = task
+            label = _task_label(task)
+            if self._labels.get(id(node)) != label:
+                node.set_label(label)
+                self._labels[id(node)] = label
+            if id(node) not in self._unloaded and not task.is_leaf():
+                self._patch_children(node, task.children, parent_path + [task.name])
+
+    def _forget_node(self, node: TreeNode[TaskNode]) -> None:
+        """Drop the bookkeeping for a node and its loaded descendants."""
+        self._task_paths.pop(id(node), None)
+        self._unloaded.discard(id(node))
+        self._labels.pop(id(node), None)
+        for child in node.children:
+            self._forget_node(child)
+
     def _add_task_node(
         self,
         parent: TreeNode[TaskNode],
         task: TaskNode,
         parent_path: list[str],
     ) -> None:
-        """Recursively add a task node to the tree.
+        """Add a task node to the tree, deferring its children.
 
         Args:
             parent: The parent tree node.
@@ -96,28 +164,38 @@ class TaskTreeWidget(Tree[TaskNode]):
             parent_path: Path to the parent node.
         """
         current_path = parent_path + [task.name]
-
-        # Build the label with status icon
-        icon = STATUS_ICONS.get(task.status, "[ ]")
-        if task.is_leaf():
-            label = f"{icon} {task.name}"
-        else:
-            # Non-leaf nodes show as folders/groups
-            label = f"[bold]{icon} {task.name}[/bold]"
+        label = _task_label(task)
 
         # Add the node
         if task.is_leaf():
             # Leaf nodes don't expand
             node = parent.add_leaf(label, data=task)
         else:
-            # Non-leaf nodes can expand
-            node = parent.add(label, data=task)
-            # Add children
-            for child in task.children:
-                self._add_task_node(node, child, current_path)
+            # Non-leaf nodes can expand; children are added on first expand
+            node = parent.add(label, data=task, allow_expand=True)
+            self._unloaded.add(id(node))
 
         # Store the path mapping
         self._task_paths[id(node)] = current_path
+        self._labels[id(node)] = label
+
+    def _ensure_children(self, node: TreeNode[TaskNode]) -> None:
+        """Add a node's children if they haven't been added yet.
+
+        Args:
+            node: The tree node about to be expanded or searched.
+        """
+        if id(node) not in self._unloaded:
+            return
+        self._unloaded.discard(id(node))
+
+        path = self._task_paths.get(id(node), [])
+        for child in node.data.children:
+            self._add_task_node(node, child, path)
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded[TaskNode]) -> None:
+        """Populate a branch the first time it is expanded."""
+        self._ensure_children(event.node)
 
     def on_tree_node_selected(self, event: Tree.NodeSelected[TaskNode]) -> None:
         """Handle node selection and post TaskSelected message."""
@@ -144,13 +222,9 @@ class TaskTreeWidget(Tree[TaskNode]):
             return
 
         # Update the label
-        icon = STATUS_ICONS.get(task.status, "[ ]")
-        if task.is_leaf():
-            label = f"{icon} {task.name}"
-        else:
-            label = f"[bold]{icon} {task.name}[/bold]"
-
+        label = _task_label(task)
         node.set_label(label)
+        self._labels[id(node)] = label
         node.data = task
 
     def _find_node_by_path(self, path: list[str]) -> Optional[TreeNode[TaskNode]]:
@@ -170,6 +244,7 @@ class TaskTreeWidget(Tree[TaskNode]):
 
         current_node = self.root
         for name in search_path:
+            self._ensure_children(current_node)
             found = False
             for child in current_node.children:
                 if child.data and child.data.name == name:
@@ -196,6 +271,7 @@ class TaskTreeWidget(Tree[TaskNode]):
         current_node.expand()
 
         for name in search_path:
+            self._ensure_children(current_node)
             for child in current_node.children:
                 if child.data and child.data.name == name:
                     child.expand()
@@ -214,6 +290,7 @@ class TaskTreeWidget(Tree[TaskNode]):
     def expand_all(self) -> None:
         """Expand all nodes in the tree."""
         def expand_recursive(node: TreeNode[TaskNode]) -> None:
+            self._ensure_children(node)
             node.expand()
             for child in node.children:
                 expand_recursive(child)